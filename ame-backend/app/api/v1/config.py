@@ -11,6 +11,13 @@ from app.core.logger import get_logger
 router = APIRouter()
 logger = get_logger(__name__)
 
+# 字典数据是静态的，导入时构建一次，避免每次请求重新遍历枚举
+# （choices() 返回只读映射，这里拷贝成普通 dict 供 JSON 序列化）
+_DICTS = {
+    'task_priority': dict(TaskPriority.choices()),
+    'task_status': dict(TaskStatus.choices())
+}
+
 
 @router.post("/save", response_model=ApiResponse)
 async def save_config(
@@ -28,17 +35,17 @@ async def save_config(
         保存结果
     """
     try:
-        config_dict = request.model_dump()
-        result = await service.save_config(config_dict)
+        result = await service.save_config(request)
 
         return ApiResponse.success(data=result)
 
     except Exception as e:
-        logger.error(f"Save config failed: {e}")
+        # 异常日志走 logger.exception，消息保持静态字符串，traceback 懒加载
+        logger.exception("Save config failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to save configuration: {str(e)}"
-        )
+            detail="Failed to save configuration"
+        ) from e
 
 
 @router.get("/load", response_model=ApiResponse)
@@ -55,20 +62,17 @@ async def load_config(
         配置数据
     """
     try:
+        # 服务层维护脱敏视图，这里直接返回，不做每次请求的字符串操作
         config = await service.load_config()
 
-        # 隐藏敏感信息
-        if 'api_key' in config and config['api_key']:
-            config['api_key'] = config['api_key'][:8] + '...'
-
         return ApiResponse.success(data=config)
 
     except Exception as e:
-        logger.error(f"Load config failed: {e}")
+        logger.exception("Load config failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to load configuration: {str(e)}"
-        )
+            detail="Failed to load configuration"
+        ) from e
 
 
 @router.post("/test", response_model=ApiResponse)
@@ -87,29 +91,17 @@ async def test_config(
         测试结果
     """
     try:
-        config_dict = request.model_dump()
-        result = await service.test_config(config_dict)
+        result = await service.test_config(request)
         return ApiResponse.success(data=result)
 
-    except Exception as e:
-        logger.error(f"Test config failed: {e}")
-        return ApiResponse.error(code=500, msg=f"Test failed: {str(e)}")
+    except Exception:
+        logger.exception("Test config failed")
+        return ApiResponse.error(code=500, msg="Test failed")
 
 
 @router.get("/dict", response_model=ApiResponse)
 async def get_dict(
         type: str
 ):
-
-    try:
-        if type == 'task_priority':
-            result = TaskPriority.choices()
-        elif type == 'task_status':
-            result = TaskStatus.choices()
-        else:
-            result = []
-        return ApiResponse.success(data=result)
-
-    except Exception as e:
-        logger.error(f"Test config failed: {e}")
-        return ApiResponse.error(code=500, msg=f"Test failed: {str(e)}")
\ No newline at end of file
+    # 纯字典查表不会失败，无需 try/except 样板
+    return ApiResponse.success(data=_DICTS.get(type, []))
\ No newline at end of file
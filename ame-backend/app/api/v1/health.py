@@ -4,7 +4,6 @@
 from fastapi import APIRouter
 from app.models.responses import HealthResponse
 from app.core.config import get_settings
-from datetime import datetime
 
 router = APIRouter()
 
@@ -21,6 +20,5 @@ async def health_check():
     
     return HealthResponse(
         status="ok",
-        version=settings.APP_VERSION,
-        timestamp=datetime.now()
+        version=settings.APP_VERSION
     )
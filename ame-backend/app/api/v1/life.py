@@ -3,6 +3,7 @@
 提供生活相关的智能辅助功能接口
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
@@ -42,13 +43,10 @@ async def analyze_mood(
     logger.info("API: Analyze mood entry")
     
     try:
-        # 解析时间
-        entry_time = datetime.fromisoformat(request.entry_time) if request.entry_time else None
-        
-        # 调用服务
+        # 时间解析由 Pydantic 在请求模型层完成
         result = await service.analyze_mood(
             mood_entry=request.mood_entry,
-            entry_time=entry_time
+            entry_time=request.entry_time
         )
         
         return MoodAnalysisResponse(**result)
@@ -112,6 +110,28 @@ async def generate_life_summary(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/life-summary/stream")
+async def generate_life_summary_stream(
+    request: LifeSummaryRequest,
+    service: LifeService = Depends(get_life_service)
+):
+    """
+    流式生成生活总结
+
+    按 100ms 粒度增量返回总结内容，首字节延迟为首 token 延迟，
+    不必等整份报告生成完毕。
+    """
+    logger.info(f"API: Stream {request.period} life summary")
+
+    if request.period not in ["week", "month", "year"]:
+        raise HTTPException(status_code=400, detail="Invalid period. Must be 'week', 'month', or 'year'")
+
+    return StreamingResponse(
+        service.generate_life_summary_stream(period=request.period),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
 @router.post("/suggestions", response_model=LifeSuggestionsResponse)
 async def get_life_suggestions(
     request: LifeSuggestionsRequest,
@@ -149,13 +169,11 @@ async def record_life_event(
     logger.info(f"API: Record life event: {request.event_type}")
     
     try:
-        # 解析时间
-        event_time = datetime.fromisoformat(request.event_time) if request.event_time else None
-        
+        # 时间解析由 Pydantic 在请求模型层完成
         result = await service.record_life_event(
             event_content=request.event_content,
             event_type=request.event_type,
-            event_time=event_time,
+            event_time=request.event_time,
             tags=request.tags
         )
         
@@ -49,7 +49,7 @@ async def chat_stream(
                 yield "data: [DONE]\n\n"
                 
             except Exception as e:
-                logger.error(f"Stream error: {e}")
+                logger.exception("Stream error")
                 yield f"data: [ERROR]: {str(e)}\n\n"
         
         return StreamingResponse(
@@ -68,11 +68,11 @@ async def chat_stream(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Chat failed: {e}")
+        logger.exception("Chat failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Chat failed: {str(e)}"
-        )
+            detail="Chat failed"
+        ) from e
 
 
 # @router.post("/chat-sync", response_model=ChatResponse)
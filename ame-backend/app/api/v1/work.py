@@ -2,7 +2,8 @@
 工作场景 API 路由
 提供工作相关的智能辅助功能接口
 """
-from fastapi import APIRouter, HTTPException, Depends, FastAPI, Body
+from fastapi import APIRouter, HTTPException, Depends, FastAPI, Body, Response
+from pydantic import TypeAdapter
 
 from app.api.v1 import config
 from app.core.logger import get_logger
@@ -16,6 +17,10 @@ logger = get_logger(__name__)
 
 router = APIRouter()
 
+# 导入时预编译响应序列化器，复用 pydantic v2 的 Rust 序列化路径，
+# 路由内直接 dump_json 返回，跳过 FastAPI 每次请求的 response_model 解析
+_TASK_LIST_ADAPTER = TypeAdapter(ApiResponseWithPageable)
+
 
 # @router.post("/weekly-report", response_model=WeeklyReportResponse)
 # async def generate_weekly_report(
@@ -162,8 +167,8 @@ async def get_history_project_analysis(
         return ApiResponse.success(data=result)
 
     except Exception as e:
-        logger.error(f"获取历史项目分析记录失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("获取历史项目分析记录失败")
+        raise HTTPException(status_code=500, detail="获取历史项目分析记录失败") from e
 
 
 @router.post("/project/analysis", response_model=ApiResponse)
@@ -181,13 +186,13 @@ async def analysis_project_desc(
         return ApiResponse.success(data=result)
 
     except Exception as e:
-        logger.error(f"根据文本进行项目分析失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("根据文本进行项目分析失败")
+        raise HTTPException(status_code=500, detail="根据文本进行项目分析失败") from e
 
 
 @router.get("/task/list", response_model=ApiResponseWithPageable)
 async def task_list(
-        page: int = 1, size: int = 9999,
+        page: int = 1, size: int = 50,
         service: TaskService = Depends(get_task_service)
 ):
     """
@@ -197,12 +202,22 @@ async def task_list(
 
     try:
         result = await service.get_task_list(page, size)
-        pageable = Pageable(total_count=result["total"], page=page, size=size)
-        return ApiResponseWithPageable.success(data=result["items"], pageable=pageable)
+        # 服务层会把 size 钳到上限，分页信息必须回报钳后的实际值，
+        # 否则客户端按原始 size 算页数会把截断当成已到末页
+        pageable = Pageable(
+            total_count=result["total"],
+            page=result["page"],
+            size=result["size"]
+        )
+        envelope = ApiResponseWithPageable.success(data=result["items"], pageable=pageable)
+        return Response(
+            _TASK_LIST_ADAPTER.dump_json(envelope),
+            media_type="application/json"
+        )
 
     except Exception as e:
-        logger.error(f"获取任务列表失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("获取任务列表失败")
+        raise HTTPException(status_code=500, detail="获取任务列表失败") from e
 
 
 @router.post("/task/update", response_model=ApiResponse)
@@ -223,8 +238,8 @@ async def update_task(
         return ApiResponse.success(data=result)
 
     except Exception as e:
-        logger.error(f"更新任务: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("更新任务失败")
+        raise HTTPException(status_code=500, detail="更新任务失败") from e
 
 
 @router.post("/task/analysis", response_model=ApiResponse)
@@ -242,8 +257,8 @@ async def analysis_task(
         return ApiResponse.success(data=result)
 
     except Exception as e:
-        logger.error(f"任务分析: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("任务分析失败")
+        raise HTTPException(status_code=500, detail="任务分析失败") from e
 
 @router.get("/suggest", response_model=ApiResponse)
 async def suggest(
@@ -258,8 +273,8 @@ async def suggest(
         result = await service.get_suggest_by_date()
         return ApiResponse.success(data=result)
     except Exception as e:
-        logger.error(f"获取今日工作建议失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("获取今日工作建议失败")
+        raise HTTPException(status_code=500, detail="获取今日工作建议失败") from e
 
 
 @router.get("/suggest/generate", response_model=ApiResponse)
@@ -275,12 +290,14 @@ async def suggest_generate(
         result = await service.generate_and_save_suggest()
         return ApiResponse.success(data=result)
     except Exception as e:
-        logger.error(f"工作建议生成失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("工作建议生成失败")
+        raise HTTPException(status_code=500, detail="工作建议生成失败") from e
 
 
 if __name__ == "__main__":
-    app = FastAPI(title="Another Me Backend")
+    from fastapi.responses import ORJSONResponse
+
+    app = FastAPI(title="Another Me Backend", default_response_class=ORJSONResponse)
     app.include_router(router, prefix="/api/v1/work")
     app.include_router(config.router, prefix="/api/v1/config")
     import uvicorn
@@ -289,5 +306,9 @@ if __name__ == "__main__":
         app,
         host="0.0.0.0",
         port=8000,
+        # 调试入口也走 uvloop + httptools（传 app 对象无法多 worker，
+        # 生产部署用 main.py 或 gunicorn -k uvicorn.workers.UvicornWorker）
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
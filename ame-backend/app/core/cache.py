@@ -0,0 +1,128 @@
+"""
+简易 TTL 缓存
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import numpy as np
+
+# 缓存未命中哨兵：None/空列表也可能是合法的缓存值
+_MISS = object()
+
+
+def quantize_embedding(embedding):
+    """把浮点向量量化为 (int8 向量, scale)
+
+    按向量最大绝对值缩放（scale = max(abs)/127），量化后内存和
+    扫描带宽是 float32 的 1/4。int8 点积足够支撑粗筛和缓存键这类
+    只看相对相似度的场景；精排仍应使用原始 float32 向量。
+
+    :param embedding: 任意可转为一维数组的浮点向量
+    :return: (np.ndarray[int8], float scale)；零向量的 scale 为 0
+    """
+    vec = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.max(np.abs(vec))) / 127.0 if vec.size else 0.0
+    if scale == 0.0:
+        return np.zeros(vec.shape, dtype=np.int8), 0.0
+    q8 = np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+    return q8, scale
+
+
+class TTLCache:
+    """带过期时间的小型 LRU 缓存
+
+    条目在写入 ttl 秒后过期；超过 maxsize 时淘汰最久未访问的条目。
+    预期在单个事件循环内使用，不加锁。
+
+    Args:
+        maxsize: 最大条目数
+        ttl: 条目存活时间（秒）
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        # key -> (过期时刻, 值)
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """取值；不存在或已过期返回 default"""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """写入并重置过期时间"""
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """移除并返回值；不存在或已过期返回 default"""
+        item = self._data.pop(key, None)
+        if item is None:
+            return default
+        expires_at, value = item
+        return default if time.monotonic() >= expires_at else value
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def install_search_cache(repository, maxsize: int = 1024, ttl: float = 60.0):
+    """给仓库实例的 hybrid_search 套一层 TTL 结果缓存
+
+    键为 (query, top_k, int8 量化后 embedding 的摘要)：量化让
+    近乎相同的浮点查询向量落进同一条目，命中时完全绕开
+    FAISS/SQLite/图存储。命中统计暴露在
+    repository.search_cache_hits / search_cache_misses。
+
+    仓库类由外部 ame 包提供，故在实例上包装而非改类；重复调用
+    是幂等的。
+    """
+    if getattr(repository, '_search_cache_installed', False):
+        return repository
+
+    original = repository.hybrid_search
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    repository.search_cache_hits = 0
+    repository.search_cache_misses = 0
+
+    async def cached_hybrid_search(query, embedding, top_k=10, **kwargs):
+        # 带额外参数的调用形态不进缓存，直接透传
+        if kwargs:
+            return await original(query, embedding, top_k=top_k, **kwargs)
+
+        quantized, _ = quantize_embedding(embedding)
+        key = (
+            query,
+            top_k,
+            hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+        )
+
+        hit = cache.get(key, _MISS)
+        if hit is not _MISS:
+            repository.search_cache_hits += 1
+            return hit
+
+        repository.search_cache_misses += 1
+        results = await original(query, embedding, top_k=top_k)
+        cache.set(key, results)
+        return results
+
+    repository.hybrid_search = cached_hybrid_search
+    repository._search_cache_installed = True
+    return repository
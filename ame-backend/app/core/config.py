@@ -4,12 +4,26 @@
 """
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+# 数据子目录定义：(配置属性名, DATA_DIR 下的目录名)
+_SUB_DIRS = (
+    ("RAG_VECTOR_STORE_PATH", "rag_vector_store"),
+    ("MEM_VECTOR_STORE_PATH", "mem_vector_store"),
+    ("PROJECT_STORE_PATH", "project_store"),
+    ("SUGGEST_STORE_PATH", "suggest_store"),
+    ("UPLOADS_DIR", "uploads"),
+    ("CONFIG_DIR", "config"),
+)
+
+# 目录创建在进程内只做一次，配置重载时跳过重复的 stat/mkdir
+_dirs_created = False
+
 
 class Settings(BaseSettings):
     """应用配置类"""
@@ -83,33 +97,19 @@ class Settings(BaseSettings):
 
     def _init_paths(self):
         """初始化路径配置"""
-        # 确保数据目录存在
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        global _dirs_created
 
         # 设置子目录路径
-        if not self.RAG_VECTOR_STORE_PATH:
-            self.RAG_VECTOR_STORE_PATH = self.DATA_DIR / "rag_vector_store"
-            self.RAG_VECTOR_STORE_PATH.mkdir(parents=True, exist_ok=True)
-
-        if not self.MEM_VECTOR_STORE_PATH:
-            self.MEM_VECTOR_STORE_PATH = self.DATA_DIR / "mem_vector_store"
-            self.MEM_VECTOR_STORE_PATH.mkdir(parents=True, exist_ok=True)
-
-        if not self.PROJECT_STORE_PATH:
-            self.PROJECT_STORE_PATH = self.DATA_DIR / "project_store"
-            self.PROJECT_STORE_PATH.mkdir(parents=True, exist_ok=True)
-
-        if not self.SUGGEST_STORE_PATH:
-            self.SUGGEST_STORE_PATH = self.DATA_DIR / "suggest_store"
-            self.SUGGEST_STORE_PATH.mkdir(parents=True, exist_ok=True)
+        for attr, sub_dir in _SUB_DIRS:
+            if not getattr(self, attr):
+                setattr(self, attr, self.DATA_DIR / sub_dir)
 
-        if not self.UPLOADS_DIR:
-            self.UPLOADS_DIR = self.DATA_DIR / "uploads"
-            self.UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
-
-        if not self.CONFIG_DIR:
-            self.CONFIG_DIR = self.DATA_DIR / "config"
-            self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        # 目录创建只在进程内执行一次（reload 时目录已存在，无需重复 syscall）
+        if not _dirs_created:
+            self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+            for attr, _ in _SUB_DIRS:
+                getattr(self, attr).mkdir(parents=True, exist_ok=True)
+            _dirs_created = True
 
     def _init_config(self):
         """初始化配置"""
@@ -149,17 +149,17 @@ class Settings(BaseSettings):
         return bool(self.OPENAI_API_KEY)
 
 
-# 全局配置实例
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """获取配置实例"""
-    return settings
+    """获取配置实例
+
+    lru_cache 保证 Settings 只构造一次（目录创建、config.json 读取
+    都只发生一次），重新加载通过 reload_settings 清空缓存实现。
+    """
+    return Settings()
 
 
 def reload_settings():
     """重新加载配置"""
-    global settings
-    settings = Settings()
-    return settings
+    get_settings.cache_clear()
+    return get_settings()
@@ -0,0 +1,27 @@
+"""
+文件 I/O 辅助函数
+"""
+import os
+from pathlib import Path
+
+from app.core.pools import run_io
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """原子写文本文件
+
+    先写同目录临时文件再 os.replace 到目标路径：替换本身是原子的，
+    并发读方要么看到旧内容要么看到新内容，不会读到半截文件。
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text, encoding=encoding)
+    os.replace(tmp, path)
+
+
+async def aio_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """异步原子写文本文件
+
+    写盘（含 fsync）放到线程池执行，API 协程不在磁盘 I/O 上停留。
+    """
+    await run_io(write_text_atomic, path, text, encoding)
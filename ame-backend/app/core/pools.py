@@ -0,0 +1,48 @@
+"""
+任务池划分
+I/O 密集与 CPU 密集的工作分别走不同的池，避免 CPU 重活饿死 I/O 回调
+"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# I/O 并发上限（HTTP / 向量库 / 文件等），远大于默认 40 线程池
+IO_SEMAPHORE = asyncio.Semaphore(256)
+
+# CPU 进程池按需创建（fork 开销大，纯 Web 路径用不到就不建）
+_cpu_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_cpu_executor() -> ProcessPoolExecutor:
+    """获取 CPU 密集型任务进程池（懒加载）"""
+    global _cpu_executor
+    if _cpu_executor is None:
+        _cpu_executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        logger.info("CPU executor initialized (workers=%s)", os.cpu_count())
+    return _cpu_executor
+
+
+async def run_cpu(fn, *args):
+    """在 CPU 进程池中执行函数，不阻塞事件循环"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_cpu_executor(), fn, *args)
+
+
+async def run_io(fn, *args, **kwargs):
+    """在线程池中执行阻塞 I/O，受 IO_SEMAPHORE 并发上限约束"""
+    async with IO_SEMAPHORE:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+
+def shutdown_pools():
+    """关闭进程池（供应用关闭时调用）"""
+    global _cpu_executor
+    if _cpu_executor is not None:
+        _cpu_executor.shutdown(wait=False)
+        _cpu_executor = None
+        logger.info("CPU executor shutdown")
@@ -1,35 +1,109 @@
+import asyncio
+import os
+
 from falkordb import FalkorDB
 
 from app.core.config import get_settings
+from app.core.logger import get_logger
+from app.core.pools import run_io
+
+logger = get_logger(__name__)
+
+# 连接池大小：FalkorDB 客户端是单 socket 的，并发查询会在 socket 上串行化
+_POOL_SIZE = 2 * (os.cpu_count() or 4)
 
 
 class FalkorDataModel:
-    def __init__(self):
+    def __init__(self, pool_size: int = _POOL_SIZE):
         """
-        初始化 FalkorDB 客户端
+        初始化 FalkorDB 客户端（连接池）
+
+        :param pool_size: 池中客户端数量
         """
         settings = get_settings()
         self.db = FalkorDB(host=settings.FALKOR_HOST, port=settings.FALKOR_PORT)
+        # 同步调用方使用的固定句柄（不进池）
         self.graph = self.db.select_graph(settings.FALKOR_GRAPH_NAME)
 
-    def query(self, cypher_query):
+        # 异步查询从池中借还客户端，互不阻塞
+        self._pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(pool_size):
+            client = FalkorDB(host=settings.FALKOR_HOST, port=settings.FALKOR_PORT)
+            self._pool.put_nowait(client.select_graph(settings.FALKOR_GRAPH_NAME))
+
+    def query(self, cypher_query, params=None):
         """
         执行 Cypher 查询并返回结果
 
         :param cypher_query: Cypher 查询字符串
+        :param params: 查询参数（可选）
+        :return: 查询结果（字典列表）
+        """
+        return self._query_graph(self.graph, cypher_query, params)
+
+    async def aquery(self, cypher_query, params=None):
+        """
+        从连接池借一个客户端，在线程池中执行 Cypher 查询
+
+        :param cypher_query: Cypher 查询字符串
+        :param params: 查询参数（可选）
         :return: 查询结果（字典列表）
         """
+        graph = await self._pool.get()
         try:
-            result = self.graph.query(cypher_query)
-            # 将结果转换为字典列表（便于处理）
-            return [record.__dict__ for record in result.result_set]
-        except Exception as e:
-            print(f"Query failed: {e}")
+            return await run_io(
+                self._query_graph, graph, cypher_query, params
+            )
+        finally:
+            self._pool.put_nowait(graph)
+
+    async def aupsert_entities(self, entities):
+        """
+        单条 UNWIND 批量写入实体节点
+
+        逐个实体一条 MERGE 时，每个实体都要付一次网络往返和解析开销；
+        UNWIND 把整批压进一次查询，实体图写入从 O(N) 次往返降到 O(1)。
+
+        :param entities: 实体列表，每项为 {"name": str, "vec": list | None}
+        :return: 写入的实体数量
+        """
+        if not entities:
+            return 0
+        await self.aquery(
+            "UNWIND $entities AS e "
+            "MERGE (n:Entity {name: e.name}) "
+            "SET n.embedding = e.vec",
+            params={"entities": [
+                {"name": e["name"], "vec": e.get("vec")} for e in entities
+            ]}
+        )
+        return len(entities)
+
+    def _query_graph(self, graph, cypher_query, params=None):
+        """在指定客户端上同步执行 Cypher 查询（内部方法）"""
+        try:
+            result = graph.query(cypher_query, params) if params else \
+                graph.query(cypher_query)
+            # 用返回头的列名按位置组装字典，避免逐条反射 record.__dict__
+            header = [col[1] for col in result.header]
+            return [dict(zip(header, record)) for record in result.result_set]
+        except Exception:
+            logger.exception("Query failed: %s", cypher_query)
             return None
 
 _falkor_db = None
-def get_falkor_db() -> FalkorDataModel:
+_init_lock = asyncio.Lock()
+
+
+async def get_falkor_db() -> FalkorDataModel:
+    """获取 FalkorDB 客户端实例
+
+    双重检查 + asyncio.Lock 防止并发首次请求创建多个连接，
+    实际的 TCP 连接放到线程池里建立，避免阻塞事件循环。
+    """
     global _falkor_db
     if _falkor_db is None:
-        _falkor_db = FalkorDataModel()
+        async with _init_lock:
+            if _falkor_db is None:
+                _falkor_db = await run_io(FalkorDataModel)
     return _falkor_db
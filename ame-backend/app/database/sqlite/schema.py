@@ -1,4 +1,7 @@
+import asyncio
+
 from app.core.config import get_settings
+from app.core.pools import run_io
 from app.database.sqlite.sqlite import TableConfig, Sqlite3DataModule
 
 TASK_DB_CONFIG = TableConfig(
@@ -14,16 +17,28 @@ TASK_DB_CONFIG = TableConfig(
 )
 
 _sqlite_db = None
+_init_lock = asyncio.Lock()
+
+
+def _create_sqlite_db() -> Sqlite3DataModule:
+    setting = get_settings()
+    return Sqlite3DataModule(
+        workdir=str(setting.PROJECT_STORE_PATH),
+        db_name='another_me',
+        tables=[TASK_DB_CONFIG],
+        auto_connect=True
+    )
+
 
+async def get_sqlite_db() -> Sqlite3DataModule:
+    """获取 SQLite 数据库模块实例
 
-def get_sqlite_db() -> Sqlite3DataModule:
+    双重检查 + asyncio.Lock 防止并发首次请求创建多个连接，
+    文件打开和建表放到线程池里执行，避免阻塞事件循环。
+    """
     global _sqlite_db
     if _sqlite_db is None:
-        setting = get_settings()
-        _sqlite_db = Sqlite3DataModule(
-            workdir=str(setting.PROJECT_STORE_PATH),
-            db_name='another_me',
-            tables=[TASK_DB_CONFIG],
-            auto_connect=True
-        )
+        async with _init_lock:
+            if _sqlite_db is None:
+                _sqlite_db = await run_io(_create_sqlite_db)
     return _sqlite_db
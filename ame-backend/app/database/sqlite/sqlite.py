@@ -1,20 +1,118 @@
 from __future__ import annotations
 
+import array
+import asyncio
 import os
+import re
 import sqlite3
 import threading
-from dataclasses import dataclass
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from app.core.logger import get_logger
+from app.core.pools import run_io
 
 logger = get_logger(__name__)
 
-_write_lock = threading.Lock()
+# sqlite3 连接内部的预编译语句缓存条数
+_CACHED_STATEMENTS = 256
+# 游标级 LRU 缓存条数（SQL 文本 -> 复用游标）
+_STMT_CACHE_SIZE = 128
+# 只读连接池大小
+_READ_POOL_SIZE = 4
 
+# 合法 SQL 标识符：字母/下划线开头，仅含字母、数字、下划线
+_IDENT_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
 
-@dataclass
+
+def _quote_ident(name: str) -> str:
+    """校验并用双引号包裹 SQL 标识符
+
+    非法标识符在构建 SQL 前（通常在注册表配置时）就抛出，
+    而不是执行时才由 SQLite 报语法错误。
+    """
+    if not _IDENT_RE.match(name):
+        raise ValueError(f"非法的 SQL 标识符: {name!r}")
+    return f'"{name}"'
+
+
+# 占位符字符串按参数个数缓存（'?, ?, ?'），热路径不再重复 join
+_QMARKS: Dict[int, str] = {}
+
+
+def _qmarks(n: int) -> str:
+    """返回 n 个参数占位符组成的字符串（缓存）"""
+    s = _QMARKS.get(n)
+    if s is None:
+        s = ', '.join(['?'] * n)
+        _QMARKS[n] = s
+    return s
+
+
+# 连接级默认 pragma（注意：WAL 要求数据库文件在本地文件系统上）
+_DEFAULT_PRAGMAS: Dict[str, Any] = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',      # 每次 COMMIT 一次同步而非两次
+    'cache_size': -65536,         # 64 MiB 页缓存
+    'mmap_size': 268435456,       # 256 MiB 内存映射读
+    'temp_store': 'MEMORY',
+    'foreign_keys': 'ON',
+    'busy_timeout': 5000,         # 写冲突等待而非立即抛 SQLITE_BUSY
+}
+
+
+class SqliteReadPool:
+    """只读连接池
+
+    为异步读路径预开 N 条只读连接（mode=ro + query_only），
+    并发查询各持一条连接，不再在单连接上串行化。
+    连接在首次 acquire 时才打开，保证库文件已存在。
+    """
+
+    def __init__(self, db_path: Path, size: int = _READ_POOL_SIZE):
+        self._db_path = db_path
+        self._size = size
+        self._queue: Optional[asyncio.Queue] = None
+
+    def _open_ro(self) -> sqlite3.Connection:
+        """打开一条只读连接
+
+        cache=shared 让池内连接共用一份页缓存：内存只占一份，
+        且任一连接读热的页对整个池生效。写连接不开共享缓存，
+        保持写路径的隔离语义不变。
+        """
+        conn = sqlite3.connect(
+            f"file:{self._db_path}?mode=ro&cache=shared",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=true")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @asynccontextmanager
+    async def acquire(self):
+        """借出一条只读连接（异步上下文管理器）"""
+        if self._queue is None:
+            queue: asyncio.Queue = asyncio.Queue()
+            for _ in range(self._size):
+                queue.put_nowait(self._open_ro())
+            self._queue = queue
+
+        conn = await self._queue.get()
+        try:
+            yield conn
+        finally:
+            self._queue.put_nowait(conn)
+
+
+@dataclass(slots=True)
 class TableConfig:
     """表配置数据类
 
@@ -29,32 +127,112 @@ class TableConfig:
     primary_key: str = 'id'
     auto_increment: bool = True
 
+    # register_table 时校验并预引号的标识符（拼 SQL 时直接取用）
+    q_name: Optional[str] = None
+    q_columns: Optional[Dict[str, str]] = None
+
+    # register_table 时预编译的 SQL 模板（整行插入/全表查询走快路径）
+    insert_cols_tuple: Optional[Tuple[str, ...]] = None
+    insert_sql_full: Optional[str] = None
+    insert_or_ignore_sql_full: Optional[str] = None
+    select_all_sql: Optional[str] = None
+    count_sql: Optional[str] = None
+
+    def compile_templates(self):
+        """预编译常用 SQL 模板
+
+        列集在注册时已知，标识符在这里统一校验并加引号，
+        整行 INSERT、全表 SELECT/COUNT 的 SQL 一次构建好，
+        热路径上不再做字符串拼接。
+        """
+        self.q_name = _quote_ident(self.name)
+        self.q_columns = {c: _quote_ident(c) for c in self.columns}
+
+        cols = tuple(sorted(
+            c for c in self.columns
+            if not (self.auto_increment and c == self.primary_key)
+        ))
+        columns_sql = ', '.join(self.q_columns[c] for c in cols)
+        placeholders = _qmarks(len(cols))
+
+        self.insert_cols_tuple = cols
+        self.insert_sql_full = (
+            f"INSERT INTO {self.q_name} ({columns_sql}) VALUES ({placeholders})"
+        )
+        self.insert_or_ignore_sql_full = (
+            f"INSERT OR IGNORE INTO {self.q_name} ({columns_sql}) VALUES ({placeholders})"
+        )
+        self.select_all_sql = f"SELECT * FROM {self.q_name}"
+        self.count_sql = f"SELECT COUNT(*) FROM {self.q_name}"
+
     def get_create_sql(self) -> str:
         """生成创建表的 SQL 语句"""
+        q_name = self.q_name or _quote_ident(self.name)
+        q_columns = self.q_columns or {c: _quote_ident(c) for c in self.columns}
+        q_pk = q_columns.get(self.primary_key) or _quote_ident(self.primary_key)
         col_defs = []
 
         # 添加主键
         if self.auto_increment:
-            col_defs.append(f"{self.primary_key} INTEGER PRIMARY KEY AUTOINCREMENT")
+            col_defs.append(f"{q_pk} INTEGER PRIMARY KEY AUTOINCREMENT")
         else:
-            col_defs.append(f"{self.primary_key} {self.columns.get(self.primary_key, 'INTEGER')} PRIMARY KEY")
+            col_defs.append(f"{q_pk} {self.columns.get(self.primary_key, 'INTEGER')} PRIMARY KEY")
 
         # 添加其他列
         for col_name, col_type in self.columns.items():
             if col_name != self.primary_key:
-                col_defs.append(f"{col_name} {col_type}")
+                col_defs.append(f"{q_columns[col_name]} {col_type}")
 
-        return f"CREATE TABLE IF NOT EXISTS {self.name} ({', '.join(col_defs)})"
+        return f"CREATE TABLE IF NOT EXISTS {q_name} ({', '.join(col_defs)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """查询结果封装类
 
     提供属性访问和方法访问两种方式
     """
     columns: List[str]
-    rows: List[Tuple]
+    # sqlite3.Row 同时支持下标和列名访问，直接持有游标返回的行，
+    # 不再逐行重建 tuple
+    rows: List[Any]
+    _col_idx: Dict[str, int] = field(init=False, repr=False)
+    _col_cache: Dict[str, Any] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # 列名 -> 下标映射，供按列访问时复用
+        self._col_idx = {c: i for i, c in enumerate(self.columns)}
+        # 按列提取的缓存（SoA 视图按需构建）
+        self._col_cache: Dict[str, Any] = {}
+
+    def column(self, name: str):
+        """按列提取数据（SoA 视图，结果缓存）
+
+        整数列返回 array.array('q')、浮点列返回 array.array('d')，
+        可通过 np.frombuffer 零拷贝转 NumPy 做向量化聚合；
+        文本/混合列退回 Python list。
+        """
+        cached = self._col_cache.get(name)
+        if cached is not None:
+            return cached
+
+        idx = self._col_idx[name]
+        values = [row[idx] for row in self.rows]
+
+        col: Any = values
+        if values:
+            first = values[0]
+            try:
+                if type(first) is int:
+                    col = array.array('q', values)
+                elif type(first) is float:
+                    col = array.array('d', values)
+            except (TypeError, OverflowError):
+                # 混合类型或数值越界，保持 list
+                col = values
+
+        self._col_cache[name] = col
+        return col
 
     def __getitem__(self, index: int) -> Dict[str, Any]:
         """通过索引访问行数据"""
@@ -66,14 +244,19 @@ class QueryResult:
         """返回结果行数"""
         return len(self.rows)
 
-    def __iter__(self):
-        """迭代器支持"""
+    def iter_dicts(self):
+        """惰性逐行生成字典，不一次性物化整个结果集"""
+        columns = self.columns
         for row in self.rows:
-            yield dict(zip(self.columns, row))
+            yield dict(zip(columns, row))
+
+    def __iter__(self):
+        """迭代器支持（惰性）"""
+        return self.iter_dicts()
 
     def to_dict_list(self) -> List[Dict[str, Any]]:
-        """转换为字典列表"""
-        return [dict(zip(self.columns, row)) for row in self.rows]
+        """转换为字典列表（显式物化时才构建）"""
+        return list(self.iter_dicts())
 
     def first(self) -> Optional[Dict[str, Any]]:
         """获取第一行"""
@@ -87,6 +270,8 @@ class QueryResult:
 class TableAccessor:
     """表访问器，提供对特定表的操作接口"""
 
+    __slots__ = ('_db', '_table_name')
+
     def __init__(self, db_module: 'Sqlite3DataModule', table_name: str):
         self._db = db_module
         self._table_name = table_name
@@ -127,6 +312,18 @@ class TableAccessor:
         """
         return self._db.update(self._table_name, data, where)
 
+    def update_many(self, rows: List[Dict[str, Any]], key: str = 'id') -> int:
+        """按主键批量更新数据
+
+        Args:
+            rows: 行数据字典列表（每行需含 key 列，其余列为要更新的值）
+            key: 定位行的列名，默认为 'id'
+
+        Returns:
+            影响的行数
+        """
+        return self._db.update_many(self._table_name, rows, key)
+
     def delete(self, where: Dict[str, Any]) -> int:
         """删除数据
 
@@ -158,6 +355,24 @@ class TableAccessor:
         """
         return self._db.select(self._table_name, columns, where, order_by, limit, offset)
 
+    def select_iter(self,
+                    columns: Optional[List[str]] = None,
+                    where: Optional[Dict[str, Any]] = None,
+                    order_by: Optional[str] = None,
+                    chunk: int = 1000):
+        """流式查询数据（逐行产出字典，内存 O(chunk)）
+
+        Args:
+            columns: 要查询的列名列表
+            where: 条件字典
+            order_by: 排序字段
+            chunk: 每次从游标取回的行数
+
+        Yields:
+            字典形式的行数据
+        """
+        return self._db.select_iter(self._table_name, columns, where, order_by, chunk)
+
     def select_one(self, where: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """查询单行数据
 
@@ -167,8 +382,14 @@ class TableAccessor:
         Returns:
             字典形式的行数据，如果不存在则返回 None
         """
-        result = self.select(where=where, limit=1)
-        return result.first()
+        # 直接取一行，跳过 QueryResult 的构建
+        sql, params = self._db._build_select_sql(
+            self._table_name, None, where, None, 1, None
+        )
+        row = self._db.execute(sql, params).fetchone()
+        if row is None:
+            return None
+        return dict(zip(row.keys(), row))
 
     def count(self, where: Optional[Dict[str, Any]] = None) -> int:
         """统计行数
@@ -190,7 +411,64 @@ class TableAccessor:
         Returns:
             是否存在
         """
-        return self.count(where) > 0
+        # SELECT 1 ... LIMIT 1 命中第一行即返回，不像 COUNT(*) 扫全部匹配行
+        quoted = self._db._quoted
+        table = self._table_name
+        where_cols = sorted(where.keys())
+        where_clause = ' AND '.join(
+            f"{quoted(table, k)} = ?" for k in where_cols
+        )
+        sql = f"SELECT 1 FROM {quoted(table)} WHERE {where_clause} LIMIT 1"
+        cursor = self._db.execute(sql, tuple(where[c] for c in where_cols))
+        return cursor.fetchone() is not None
+
+    # ==================== 异步接口 ====================
+    # sqlite3 本身是同步的，异步调用方通过 run_io 走线程池
+    # （受 IO_SEMAPHORE 并发上限约束），避免在事件循环中直接做磁盘 I/O
+
+    async def ainsert(self, data: Dict[str, Any], ignore_conflict: bool = False) -> int:
+        """异步插入数据"""
+        return await run_io(self.insert, data, ignore_conflict)
+
+    async def ainsert_many(self, data_list: List[Dict[str, Any]], ignore_conflict: bool = False) -> int:
+        """异步批量插入数据"""
+        return await run_io(self.insert_many, data_list, ignore_conflict)
+
+    async def aupdate(self, data: Dict[str, Any], where: Dict[str, Any]) -> int:
+        """异步更新数据"""
+        return await run_io(self.update, data, where)
+
+    async def aupdate_many(self, rows: List[Dict[str, Any]], key: str = 'id') -> int:
+        """异步按主键批量更新数据"""
+        return await run_io(self.update_many, rows, key)
+
+    async def adelete(self, where: Dict[str, Any]) -> int:
+        """异步删除数据"""
+        return await run_io(self.delete, where)
+
+    async def aselect(self,
+                      columns: Optional[List[str]] = None,
+                      where: Optional[Dict[str, Any]] = None,
+                      order_by: Optional[str] = None,
+                      limit: Optional[int] = None,
+                      offset: Optional[int] = None) -> QueryResult:
+        """异步查询数据（走只读连接池）"""
+        return await self._db.async_select(
+            self._table_name, columns, where, order_by, limit, offset
+        )
+
+    async def aselect_one(self, where: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """异步查询单行数据（走只读连接池）"""
+        result = await self.aselect(where=where, limit=1)
+        return result.first()
+
+    async def acount(self, where: Optional[Dict[str, Any]] = None) -> int:
+        """异步统计行数"""
+        return await run_io(self.count, where)
+
+    async def aexists(self, where: Dict[str, Any]) -> bool:
+        """异步检查是否存在符合条件的记录"""
+        return await run_io(self.exists, where)
 
 
 class Sqlite3DataModule:
@@ -231,7 +509,8 @@ class Sqlite3DataModule:
                  workdir: str,
                  db_name: str,
                  tables: Optional[List[TableConfig]] = None,
-                 auto_connect: bool = True):
+                 auto_connect: bool = True,
+                 pragmas: Optional[Dict[str, Any]] = None):
         """初始化数据库模块
 
         Args:
@@ -239,7 +518,9 @@ class Sqlite3DataModule:
             db_name: 数据库名称（不包含 .db 后缀）
             tables: 表配置列表
             auto_connect: 是否自动连接数据库
+            pragmas: 连接级 pragma 覆盖项（与默认值合并，按部署调优）
         """
+        self._pragmas: Dict[str, Any] = {**_DEFAULT_PRAGMAS, **(pragmas or {})}
         self._workdir = Path(workdir)
         self._db_name = db_name if db_name.endswith('.db') else f"{db_name}.db"
         self._db_path = self._workdir / self._db_name
@@ -247,6 +528,11 @@ class Sqlite3DataModule:
         self._cursor: Optional[sqlite3.Cursor] = None
         self._tables: Dict[str, TableConfig] = {}
         self._table_accessors: Dict[str, TableAccessor] = {}
+        # 每个线程一条连接（含自己的游标 LRU），写入串行化交给 SQLite 的
+        # busy_timeout，WAL 模式下读写互不阻塞，无需进程级写锁
+        self._tls = threading.local()
+        # 异步读路径的只读连接池
+        self._read_pool = SqliteReadPool(self._db_path)
 
         # 确保工作目录存在
         self._workdir.mkdir(parents=True, exist_ok=True)
@@ -288,24 +574,48 @@ class Sqlite3DataModule:
         Args:
             table_config: 表配置对象
         """
+        table_config.compile_templates()
         self._tables[table_config.name] = table_config
         logger.info(f"注册表配置: {table_config.name}")
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """打开一条新连接并应用性能 pragma"""
+        conn = sqlite3.connect(
+            str(self._db_path),
+            isolation_level=None,  # 自动提交，事务由调用方显式控制
+            cached_statements=_CACHED_STATEMENTS
+        )
+        conn.row_factory = sqlite3.Row  # 支持按列名访问
+        # WAL 模式下读写互不阻塞，写入只需同步 WAL 文件，吞吐明显更高
+        for pragma, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {pragma}={value}")
+        return conn
+
     def connect(self):
-        """连接数据库"""
+        """连接数据库（打开引导连接，线程连接按需创建）"""
         if self._conn is not None:
             logger.warning("数据库已连接，无需重复连接")
             return
 
         try:
-            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row  # 支持按列名访问
+            # 引导连接负责建表等初始化；各工作线程走 _get_conn 的线程本地连接
+            self._conn = self._open_connection()
             self._cursor = self._conn.cursor()
-            logger.info(f"成功连接数据库: {self._db_path}")
+            logger.info(f"成功连接数据库: {self._db_path}, pragmas: {self._pragmas}")
         except Exception as e:
             logger.error(f"连接数据库失败: {e}")
             raise
 
+    def _get_conn(self) -> sqlite3.Connection:
+        """获取当前线程的连接（懒创建）"""
+        self._ensure_connection()
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._tls.conn = conn
+            self._tls.stmt_cache = OrderedDict()
+        return conn
+
     def disconnect(self):
         """断开数据库连接"""
         if self._conn:
@@ -314,6 +624,12 @@ class Sqlite3DataModule:
                 self._conn.close()
                 self._conn = None
                 self._cursor = None
+                # 当前线程的连接一并关闭；其他线程的连接随线程结束释放
+                tls_conn = getattr(self._tls, 'conn', None)
+                if tls_conn is not None:
+                    tls_conn.close()
+                    self._tls.conn = None
+                    self._tls.stmt_cache = None
                 logger.info("数据库连接已断开")
             except Exception as e:
                 logger.error(f"断开数据库连接失败: {e}")
@@ -339,8 +655,25 @@ class Sqlite3DataModule:
 
         self._conn.commit()
 
+    def _get_cursor(self, conn: sqlite3.Connection, sql: str) -> sqlite3.Cursor:
+        """按 SQL 文本取当前线程的复用游标（LRU）
+
+        相同 SQL 走同一个游标，sqlite3 内部的语句缓存
+        （cached_statements）即可命中，跳过重复的 parse 和 schema 查找。
+        """
+        cache: OrderedDict = self._tls.stmt_cache
+        cursor = cache.get(sql)
+        if cursor is None:
+            cursor = conn.cursor()
+            if len(cache) >= _STMT_CACHE_SIZE:
+                cache.popitem(last=False)
+            cache[sql] = cursor
+        else:
+            cache.move_to_end(sql)
+        return cursor
+
     def execute(self, sql: str, params: Optional[Tuple] = None) -> sqlite3.Cursor:
-        """执行 SQL 语句
+        """执行 SQL 语句（自动提交，当前线程的连接）
 
         Args:
             sql: SQL 语句
@@ -349,20 +682,45 @@ class Sqlite3DataModule:
         Returns:
             游标对象
         """
-        self._ensure_connection()
+        conn = self._get_conn()
 
         try:
+            cursor = self._get_cursor(conn, sql)
             if params:
-                cursor = self._cursor.execute(sql, params)
+                cursor.execute(sql, params)
             else:
-                cursor = self._cursor.execute(sql)
-            self._conn.commit()
+                cursor.execute(sql)
             return cursor
-        except Exception as e:
-            logger.error(f"执行 SQL 失败: {sql}, 错误: {e}")
-            self._conn.rollback()
+        except Exception:
+            logger.exception("执行 SQL 失败: %s", sql)
             raise
 
+    @contextmanager
+    def transaction(self):
+        """显式事务上下文管理器
+
+        自动提交模式下每条写语句都付一次 fsync；批量写入时包在一个
+        事务里只在 COMMIT 时同步一次，吞吐差距可达几个数量级。
+
+        Example:
+            >>> with db.transaction():
+            ...     for row in rows:
+            ...         db.users.insert(row)
+        """
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+
+    async def aexecute(self, sql: str, params: Optional[Tuple] = None) -> sqlite3.Cursor:
+        """异步执行 SQL 语句（线程池中运行，不阻塞事件循环）"""
+        return await run_io(self.execute, sql, params)
+
     def executemany(self, sql: str, params_list: List[Tuple]) -> sqlite3.Cursor:
         """批量执行 SQL 语句
 
@@ -373,15 +731,14 @@ class Sqlite3DataModule:
         Returns:
             游标对象
         """
-        self._ensure_connection()
+        conn = self._get_conn()
 
         try:
-            cursor = self._cursor.executemany(sql, params_list)
-            self._conn.commit()
+            cursor = self._get_cursor(conn, sql)
+            cursor.executemany(sql, params_list)
             return cursor
-        except Exception as e:
-            logger.error(f"批量执行 SQL 失败: {sql}, 错误: {e}")
-            self._conn.rollback()
+        except Exception:
+            logger.exception("批量执行 SQL 失败: %s", sql)
             raise
 
     def insert(self, table: str, data: Dict[str, Any], ignore_conflict: bool = False) -> int:
@@ -395,17 +752,45 @@ class Sqlite3DataModule:
         Returns:
             插入行的 ID
         """
-        with _write_lock:
-            columns = ', '.join(data.keys())
-            placeholders = ', '.join(['?' for _ in data])
-
-            if ignore_conflict:
-                sql = f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({placeholders})"
-            else:
-                sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-
-            cursor = self.execute(sql, tuple(data.values()))
-            return cursor.lastrowid
+        sql, cols = self._insert_sql(table, data, ignore_conflict)
+        cursor = self.execute(sql, tuple(data[c] for c in cols))
+        return cursor.lastrowid
+
+    def _quoted(self, table: str, column: Optional[str] = None) -> str:
+        """取预引号的标识符：已注册的表直接查表，否则现场校验加引号"""
+        config = self._tables.get(table)
+        if column is None:
+            if config is not None and config.q_name is not None:
+                return config.q_name
+            return _quote_ident(table)
+        if config is not None and config.q_columns is not None:
+            q = config.q_columns.get(column)
+            if q is not None:
+                return q
+        return _quote_ident(column)
+
+    def _insert_sql(self, table: str, data: Dict[str, Any],
+                    ignore_conflict: bool) -> Tuple[str, Tuple[str, ...]]:
+        """取插入 SQL：整行插入走预编译模板，部分列插入动态构建"""
+        config = self._tables.get(table)
+        if config is not None and config.insert_cols_tuple is not None:
+            cols = config.insert_cols_tuple
+            if len(data) == len(cols) and all(c in data for c in cols):
+                sql = (config.insert_or_ignore_sql_full if ignore_conflict
+                       else config.insert_sql_full)
+                return sql, cols
+
+        # 动态路径：列名固定排序，相同形状生成字节一致的 SQL，语句缓存可命中
+        dyn_cols = tuple(sorted(data.keys()))
+        q_table = self._quoted(table)
+        columns = ', '.join(self._quoted(table, c) for c in dyn_cols)
+        placeholders = _qmarks(len(dyn_cols))
+
+        if ignore_conflict:
+            sql = f"INSERT OR IGNORE INTO {q_table} ({columns}) VALUES ({placeholders})"
+        else:
+            sql = f"INSERT INTO {q_table} ({columns}) VALUES ({placeholders})"
+        return sql, dyn_cols
 
     def insert_many(self, table: str, data_list: List[Dict[str, Any]], ignore_conflict: bool = False) -> int:
         """批量插入数据
@@ -418,21 +803,54 @@ class Sqlite3DataModule:
         Returns:
             插入的行数
         """
-        with _write_lock:
-            if not data_list:
-                return 0
+        if not data_list:
+            return 0
+
+        sql, cols = self._insert_sql(table, data_list[0], ignore_conflict)
+        # itemgetter 是 C 实现，比逐行 genexpr+tuple 取值明显更快；
+        # 单列时 itemgetter 返回标量，需手动包成一元组
+        if len(cols) == 1:
+            col = cols[0]
+            params_list = [(data[col],) for data in data_list]
+        else:
+            params_list = list(map(itemgetter(*cols), data_list))
+        # 整批一个事务：一次 parse、一次 COMMIT/fsync
+        with self.transaction():
+            cursor = self.executemany(sql, params_list)
+        return cursor.rowcount
 
-            columns = ', '.join(data_list[0].keys())
-            placeholders = ', '.join(['?' for _ in data_list[0]])
+    def update_many(self, table: str, rows: List[Dict[str, Any]], key: str = 'id') -> int:
+        """按主键批量更新数据
 
-            if ignore_conflict:
-                sql = f"INSERT OR IGNORE INTO {table} ({columns}) VALUES ({placeholders})"
-            else:
-                sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        单条 UPDATE 语句只解析一次，全部行在一个事务内通过
+        executemany 提交，fsync 从每行一次降为每批一次。
+
+        Args:
+            table: 表名
+            rows: 行数据字典列表（每行需含 key 列，其余列为要更新的值）
+            key: 定位行的列名，默认为 'id'
 
-            params_list = [tuple(data.values()) for data in data_list]
+        Returns:
+            影响的行数
+        """
+        if not rows:
+            return 0
+
+        # 与 insert_many 一致：按首行的列集构建 SQL，要求各行同构
+        data_cols = sorted(c for c in rows[0] if c != key)
+        set_clause = ', '.join([f"{self._quoted(table, c)} = ?" for c in data_cols])
+        sql = (
+            f"UPDATE {self._quoted(table)} SET {set_clause} "
+            f"WHERE {self._quoted(table, key)} = ?"
+        )
+        params_list = [
+            tuple([row[c] for c in data_cols] + [row[key]])
+            for row in rows
+        ]
+
+        with self.transaction():
             cursor = self.executemany(sql, params_list)
-            return cursor.rowcount
+        return cursor.rowcount
 
     def update(self, table: str, data: Dict[str, Any], where: Dict[str, Any]) -> int:
         """更新数据
@@ -445,15 +863,18 @@ class Sqlite3DataModule:
         Returns:
             影响的行数
         """
-        with _write_lock:
-            set_clause = ', '.join([f"{k} = ?" for k in data.keys()])
-            where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
+        data_cols = sorted(data.keys())
+        where_cols = sorted(where.keys())
+        set_clause = ', '.join([f"{self._quoted(table, k)} = ?" for k in data_cols])
+        where_clause = ' AND '.join([f"{self._quoted(table, k)} = ?" for k in where_cols])
 
-            sql = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-            params = tuple(list(data.values()) + list(where.values()))
+        sql = f"UPDATE {self._quoted(table)} SET {set_clause} WHERE {where_clause}"
+        params = tuple(
+            [data[c] for c in data_cols] + [where[c] for c in where_cols]
+        )
 
-            cursor = self.execute(sql, params)
-            return cursor.rowcount
+        cursor = self.execute(sql, params)
+        return cursor.rowcount
 
     def delete(self, table: str, where: Dict[str, Any]) -> int:
         """删除数据
@@ -465,8 +886,8 @@ class Sqlite3DataModule:
         Returns:
             删除的行数
         """
-        where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
-        sql = f"DELETE FROM {table} WHERE {where_clause}"
+        where_clause = ' AND '.join([f"{self._quoted(table, k)} = ?" for k in where.keys()])
+        sql = f"DELETE FROM {self._quoted(table)} WHERE {where_clause}"
 
         cursor = self.execute(sql, tuple(where.values()))
         return cursor.rowcount
@@ -491,43 +912,147 @@ class Sqlite3DataModule:
         Returns:
             QueryResult 对象
         """
-        # 构建 SELECT 子句
+        sql, params = self._build_select_sql(table, columns, where, order_by, limit, offset)
+
+        cursor = self.execute(sql, params)
+        rows = cursor.fetchall()
+
+        # 获取列名
         if columns:
-            select_clause = ', '.join(columns)
+            result_columns = columns
+        else:
+            result_columns = [desc[0] for desc in cursor.description]
+
+        return QueryResult(columns=result_columns, rows=rows)
+
+    def _build_select_sql(self,
+                          table: str,
+                          columns: Optional[List[str]] = None,
+                          where: Optional[Dict[str, Any]] = None,
+                          order_by: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          offset: Optional[int] = None) -> Tuple[str, Optional[Tuple]]:
+        """构建 SELECT 语句和参数（标识符统一经 _quoted 校验加引号）"""
+        if columns:
+            select_clause = ', '.join(self._quoted(table, c) for c in columns)
         else:
             select_clause = '*'
 
-        sql = f"SELECT {select_clause} FROM {table}"
+        sql = f"SELECT {select_clause} FROM {self._quoted(table)}"
         params = []
 
-        # 构建 WHERE 子句
         if where:
-            where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
+            where_cols = sorted(where.keys())
+            where_clause = ' AND '.join(
+                f"{self._quoted(table, k)} = ?" for k in where_cols
+            )
             sql += f" WHERE {where_clause}"
-            params.extend(where.values())
+            params.extend(where[k] for k in where_cols)
 
-        # 构建 ORDER BY 子句
         if order_by:
-            sql += f" ORDER BY {order_by}"
+            sql += f" ORDER BY {self._quote_order_by(table, order_by)}"
 
-        # 构建 LIMIT 子句
         if limit is not None:
-            sql += f" LIMIT {limit}"
+            sql += f" LIMIT {int(limit)}"
 
-        # 构建 OFFSET 子句
         if offset is not None:
-            sql += f" OFFSET {offset}"
+            sql += f" OFFSET {int(offset)}"
 
-        cursor = self.execute(sql, tuple(params) if params else None)
-        rows = cursor.fetchall()
+        return sql, tuple(params) if params else None
+
+    def _quote_order_by(self, table: str, order_by: str) -> str:
+        """校验并引号化 ORDER BY 子句
+
+        支持 "col"、"col DESC"、"a, b DESC" 这类形态；
+        列名经 _quoted 校验，排序方向只允许 ASC/DESC。
+        """
+        terms = []
+        for term in order_by.split(','):
+            parts = term.split()
+            if not parts or len(parts) > 2:
+                raise ValueError(f"非法的 ORDER BY 片段: {term!r}")
+            quoted = self._quoted(table, parts[0])
+            if len(parts) == 2:
+                direction = parts[1].upper()
+                if direction not in ('ASC', 'DESC'):
+                    raise ValueError(f"非法的排序方向: {parts[1]!r}")
+                quoted = f"{quoted} {direction}"
+            terms.append(quoted)
+        return ', '.join(terms)
+
+    def select_iter(self,
+                    table: str,
+                    columns: Optional[List[str]] = None,
+                    where: Optional[Dict[str, Any]] = None,
+                    order_by: Optional[str] = None,
+                    chunk: int = 1000):
+        """流式查询，按 chunk 批量取行并逐行产出字典
+
+        超大结果集时内存占用为 O(chunk) 而非 O(N)。
+
+        Args:
+            table: 表名
+            columns: 要查询的列名列表
+            where: 条件字典
+            order_by: 排序字段
+            chunk: 每次从游标取回的行数
+
+        Yields:
+            字典形式的行数据
+        """
+        sql, params = self._build_select_sql(table, columns, where, order_by, None, None)
+
+        # 惰性生成器不能走 _get_cursor 的复用游标：迭代期间同一条
+        # SQL 再次执行会复位那个游标，悄悄截断进行中的流。这里独占
+        # 一个专用游标，迭代完成或生成器被提前关闭时释放
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        try:
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            result_columns = columns or [desc[0] for desc in cursor.description]
+
+            while True:
+                rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(result_columns, row))
+        finally:
+            cursor.close()
+
+    async def async_select(self,
+                           table: str,
+                           columns: Optional[List[str]] = None,
+                           where: Optional[Dict[str, Any]] = None,
+                           order_by: Optional[str] = None,
+                           limit: Optional[int] = None,
+                           offset: Optional[int] = None) -> QueryResult:
+        """异步查询：从只读连接池借连接，线程池中执行
+
+        WAL 下读连接与写连接互不阻塞，并发查询各持一条池内连接。
+        """
+        sql, params = self._build_select_sql(table, columns, where, order_by, limit, offset)
+
+        async with self._read_pool.acquire() as conn:
+            result_columns, rows = await run_io(
+                self._run_read, conn, sql, params
+            )
 
-        # 获取列名
         if columns:
             result_columns = columns
-        else:
-            result_columns = [desc[0] for desc in cursor.description]
 
-        return QueryResult(columns=result_columns, rows=[tuple(row) for row in rows])
+        return QueryResult(columns=result_columns, rows=rows)
+
+    @staticmethod
+    def _run_read(conn: sqlite3.Connection, sql: str, params: Optional[Tuple]):
+        """在指定只读连接上执行查询（线程池中运行）"""
+        cursor = conn.execute(sql, params or ())
+        rows = cursor.fetchall()
+        result_columns = [desc[0] for desc in cursor.description]
+        return result_columns, rows
 
     def count(self, table: str, where: Optional[Dict[str, Any]] = None) -> int:
         """统计行数
@@ -539,13 +1064,22 @@ class Sqlite3DataModule:
         Returns:
             符合条件的行数
         """
-        sql = f"SELECT COUNT(*) FROM {table}"
+        if not where:
+            # 无条件计数走预编译模板
+            config = self._tables.get(table)
+            if config is not None and config.count_sql is not None:
+                return self.execute(config.count_sql).fetchone()[0]
+
+        sql = f"SELECT COUNT(*) FROM {self._quoted(table)}"
         params = []
 
         if where:
-            where_clause = ' AND '.join([f"{k} = ?" for k in where.keys()])
+            where_cols = sorted(where.keys())
+            where_clause = ' AND '.join(
+                f"{self._quoted(table, k)} = ?" for k in where_cols
+            )
             sql += f" WHERE {where_clause}"
-            params.extend(where.values())
+            params.extend(where[k] for k in where_cols)
 
         cursor = self.execute(sql, tuple(params) if params else None)
         return cursor.fetchone()[0]
@@ -595,7 +1129,12 @@ class Sqlite3DataModule:
         Returns:
             是否存在
         """
-        return table in self.get_table_names()
+        # 参数化点查走 sqlite_master 的内部索引，不全表扫描后在 Python 侧做 in
+        cursor = self.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=? LIMIT 1",
+            (table,)
+        )
+        return cursor.fetchone() is not None
 
     def __enter__(self):
         """上下文管理器入口"""
@@ -10,8 +10,9 @@ from pathlib import Path
 # if str(AME_ROOT) not in sys.path:
 #     sys.path.insert(0, str(AME_ROOT))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 # 将项目根目录（即包含 app/ 的目录）加入 Python 路径
@@ -20,10 +21,16 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.api.v1 import health, config, work, mem
+from app.services.project_service import get_project_service
+from app.services.suggest_service import get_suggest_service
+from app.services.task_service import get_task_service
+from app.services.work_service import get_work_service
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
 from app.core.config import get_settings
+from app.core.exceptions import APIException
 from app.core.logger import setup_logging, get_logger
+from app.models.responses import ErrorResponse
 
 # 初始化日志
 setup_logging()
@@ -40,10 +47,33 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug Mode: {settings.DEBUG}")
     logger.info(f"Data Directory: {settings.DATA_DIR}")
 
+    # 预热服务单例：数据库打开、索引加载等重型初始化在启动期完成，
+    # 首个真实请求不再踩冷启动路径
+    await get_task_service()
+    await get_suggest_service()
+    await get_project_service()
+    try:
+        # 构造 WorkService 并预热存储层（仓库支持 warmup 时强制
+        # FAISS mmap 和 SQLite 页缓存加载）；未配置 API Key 时跳过
+        work_service = await get_work_service()
+        repo_warmup = getattr(work_service.repository, 'warmup', None)
+        if repo_warmup is not None:
+            await repo_warmup()
+    except Exception as e:
+        logger.warning("Work service warmup skipped: %s", e)
+    try:
+        # life 路由当前未注册；服务可构造（已配置 API Key）时仍预热，
+        # 未配置时跳过而不阻塞启动
+        from app.services.life_service import get_life_service
+        await get_life_service()
+    except Exception as e:
+        logger.warning("Life service warmup skipped: %s", e)
+
     yield
 
     # 关闭时
     logger.info("Shutting down Another Me API...")
+    shutdown_pools()
 
 
 # 创建 FastAPI 应用
@@ -51,7 +81,9 @@ app = FastAPI(
     title="Another Me API",
     version="1.0.0",
     description="AI 数字分身系统 API - 基于 RAG 和记忆模仿技术",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson 序列化响应，比标准库 json 快数倍
+    default_response_class=ORJSONResponse
 )
 
 # 配置 CORS
@@ -71,6 +103,24 @@ app.add_middleware(ErrorHandlerMiddleware)
 # 存储设置到应用状态
 app.state.settings = settings
 
+
+@app.exception_handler(APIException)
+async def api_exception_handler(request: Request, exc: APIException):
+    """业务异常统一出口
+
+    路由内让 APIException 直接冒泡到这里，无需每个路由重复
+    try/except + f-string 的样板代码。
+    """
+    logger.warning("%s on %s: %s", exc.__class__.__name__, request.url.path, exc.message)
+    error_response = ErrorResponse(
+        error=exc.message,
+        detail=exc.detail
+    )
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content=error_response.model_dump(mode="json")
+    )
+
 # 注册路由
 app.include_router(
     health.router,
@@ -124,6 +174,8 @@ async def root():
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
     uvicorn.run(
@@ -131,5 +183,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.DEBUG,
+        # uvloop 事件循环 + httptools HTTP 解析，均为 C 实现
+        loop="uvloop",
+        http="httptools",
+        # 多 worker 吃满多核；DEBUG 模式下 reload 与多进程互斥
+        workers=None if settings.DEBUG else 2 * os.cpu_count(),
         log_level="info"
     )
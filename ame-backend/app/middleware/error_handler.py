@@ -8,7 +8,6 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.logger import get_logger
 from app.core.exceptions import APIException
 from app.models.responses import ErrorResponse
-from datetime import datetime
 import traceback
 import time
 
@@ -45,8 +44,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             logger.warning(f"{e.__class__.__name__} on {request.url.path}: {e.message}")
             error_response = ErrorResponse(
                 error=e.message,
-                detail=e.detail,
-                timestamp=datetime.now()
+                detail=e.detail
             )
             return JSONResponse(
                 status_code=e.status_code,
@@ -58,8 +56,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             logger.warning(f"ValueError on {request.url.path}: {str(e)}")
             error_response = ErrorResponse(
                 error="Invalid parameter",
-                detail=str(e),
-                timestamp=datetime.now()
+                detail=str(e)
             )
             return JSONResponse(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -71,8 +68,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             logger.error(f"FileNotFoundError on {request.url.path}: {str(e)}")
             error_response = ErrorResponse(
                 error="Resource not found",
-                detail=str(e),
-                timestamp=datetime.now()
+                detail=str(e)
             )
             return JSONResponse(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -84,8 +80,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             logger.error(f"PermissionError on {request.url.path}: {str(e)}")
             error_response = ErrorResponse(
                 error="Permission denied",
-                detail=str(e),
-                timestamp=datetime.now()
+                detail=str(e)
             )
             return JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -97,8 +92,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             logger.error(f"TimeoutError on {request.url.path}: {str(e)}")
             error_response = ErrorResponse(
                 error="Request timeout",
-                detail="The request took too long to process",
-                timestamp=datetime.now()
+                detail="The request took too long to process"
             )
             return JSONResponse(
                 status_code=status.HTTP_504_GATEWAY_TIMEOUT,
@@ -117,8 +111,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             
             error_response = ErrorResponse(
                 error="Internal server error",
-                detail=detail,
-                timestamp=datetime.now()
+                detail=detail
             )
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
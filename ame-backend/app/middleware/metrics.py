@@ -2,11 +2,14 @@
 Prometheus 监控指标中间件
 收集HTTP请求指标和业务指标
 """
+from functools import lru_cache
+
 from prometheus_client import Counter, Histogram, Gauge, generate_latest
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
-from time import time
+from starlette.routing import Match
+from time import perf_counter_ns
 from typing import Callable
 
 # ==================== HTTP 请求指标 ====================
@@ -59,60 +62,106 @@ document_operations_total = Counter(
     ['operation', 'doc_type', 'status']
 )
 
+# ==================== 标签子对象缓存 ====================
+# .labels(...) 每次调用都要做元组哈希 + 字典查找；
+# 按 (method, endpoint) 绑定一次子对象后直接 inc/observe
+
+@lru_cache(maxsize=1024)
+def _bound_children(method: str, endpoint: str):
+    """返回绑定好标签的 (in_progress, duration) 子对象"""
+    return (
+        http_requests_in_progress.labels(method=method, endpoint=endpoint),
+        http_request_duration_seconds.labels(method=method, endpoint=endpoint)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _total_child(method: str, endpoint: str, status: int):
+    """返回绑定好标签的请求计数子对象"""
+    return http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+
+
 # ==================== 中间件 ====================
 
+# 无分析价值的端点直接跳过，不产生指标序列
+_DEFAULT_SKIP_PATHS = frozenset({
+    "/metrics", "/health", "/healthz", "/favicon.ico",
+    "/docs", "/openapi.json", "/redoc"
+})
+
+
+def _route_template(request: Request) -> str:
+    """解析请求匹配的路由模板（如 /users/{user_id}）
+
+    用模板而不是原始路径做 endpoint 标签，路径参数不会把
+    Prometheus 序列基数炸成每个 ID 一条。路由尚未匹配时
+    （中间件先于路由执行）按路由表做一次匹配，未命中返回
+    "unmatched"。
+    """
+    scope = request.scope
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    for route in scope["app"].routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
 class MetricsMiddleware(BaseHTTPMiddleware):
     """HTTP指标收集中间件"""
-    
+
+    def __init__(
+        self,
+        app,
+        skip_paths: frozenset = _DEFAULT_SKIP_PATHS,
+        skip_prefixes: tuple = ()
+    ):
+        super().__init__(app)
+        self.skip_paths = skip_paths
+        self.skip_prefixes = skip_prefixes
+
     async def dispatch(
         self,
         request: Request,
         call_next: Callable
     ) -> Response:
-        # 跳过metrics端点本身
-        if request.url.path == "/metrics":
+        # 跳过metrics端点本身及健康检查/文档等静态端点
+        path = request.url.path
+        if path in self.skip_paths or (
+            self.skip_prefixes and path.startswith(self.skip_prefixes)
+        ):
             return await call_next(request)
-        
+
         method = request.method
-        endpoint = request.url.path
-        
+        endpoint = _route_template(request)
+
+        in_progress, duration_child = _bound_children(method, endpoint)
+
         # 标记请求开始
-        http_requests_in_progress.labels(
-            method=method,
-            endpoint=endpoint
-        ).inc()
-        
-        start_time = time()
-        
+        in_progress.inc()
+
+        # 单调时钟计时，整数纳秒差值，不受系统时间跳变影响
+        start = perf_counter_ns()
+
         try:
             # 执行请求
             response = await call_next(request)
             status = response.status_code
-            
+
         except Exception as e:
             status = 500
             raise
-        
+
         finally:
             # 记录指标
-            duration = time() - start_time
-            
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
-            
-            http_requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status=status
-            ).inc()
-            
-            http_requests_in_progress.labels(
-                method=method,
-                endpoint=endpoint
-            ).dec()
-        
+            duration = (perf_counter_ns() - start) * 1e-9
+
+            duration_child.observe(duration)
+            _total_child(method, endpoint, status).inc()
+            in_progress.dec()
+
         return response
 
 
@@ -1,5 +1,20 @@
 from enum import IntEnum
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
+
+# 标签表在模块加载时构建一次，to_label/choices 不再逐调用分配字典；
+# MappingProxyType 只读视图防止调用方改动共享表
+_TASK_STATUS_LABELS: Mapping[int, str] = MappingProxyType({
+    0: "未处理",
+    1: "处理中",
+    2: "已完成"
+})
+
+_TASK_PRIORITY_LABELS: Mapping[int, str] = MappingProxyType({
+    2: "高",
+    1: "中",
+    0: "低"
+})
 
 
 class TaskStatus(IntEnum):
@@ -8,23 +23,15 @@ class TaskStatus(IntEnum):
     PROCESSING = 1  # 处理中
     COMPLETED = 2  # 已完成
 
-    @classmethod
-    def to_label(cls, value: int) -> str:
+    @staticmethod
+    def to_label(value: int) -> str:
         """将状态值转为中文标签"""
-        labels = {
-            cls.PENDING: "未处理",
-            cls.PROCESSING: "处理中",
-            cls.COMPLETED: "已完成"
-        }
-        return labels.get(value, "未知状态")
-
-    @classmethod
-    def choices(cls) -> Dict[int, str]:
-        return {
-            cls.PENDING: "未处理",
-            cls.PROCESSING: "处理中",
-            cls.COMPLETED: "已完成"
-        }
+        return _TASK_STATUS_LABELS.get(value, "未知状态")
+
+    @staticmethod
+    def choices() -> Mapping[int, str]:
+        """值到标签的只读映射"""
+        return _TASK_STATUS_LABELS
 
 
 class TaskPriority(IntEnum):
@@ -33,20 +40,13 @@ class TaskPriority(IntEnum):
     MEDIUM = 1  # 中
     LOW = 0  # 低
 
-    @classmethod
-    def to_label(cls, value: int) -> str:
+    @staticmethod
+    def to_label(value: int) -> str:
         """将优先级值转为中文标签"""
-        labels = {
-            cls.HIGH: "高",
-            cls.MEDIUM: "中",
-            cls.LOW: "低"
-        }
-        return labels.get(value, f"未知优先级({value})")
-
-    @classmethod
-    def choices(cls):
-        return {
-            cls.HIGH: "高",
-            cls.MEDIUM: "中",
-            cls.LOW: "低"
-        }
+        label = _TASK_PRIORITY_LABELS.get(value)
+        return label if label is not None else f"未知优先级({value})"
+
+    @staticmethod
+    def choices() -> Mapping[int, str]:
+        """值到标签的只读映射"""
+        return _TASK_PRIORITY_LABELS
@@ -1,10 +1,35 @@
 """
 API 响应数据模型
 """
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+import time
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer
+from typing import NamedTuple, Optional, List, Any
 from datetime import datetime
 
+# 响应时间戳秒级精度足够：同一秒内复用同一个 datetime 及其
+# ISO 字符串，不再每个响应都 new 一个再格式化一遍
+_cached_sec = 0
+_cached_dt = datetime.fromtimestamp(0)
+_cached_iso = _cached_dt.isoformat()
+
+
+def _now_cached() -> datetime:
+    """秒级缓存的当前时间（供 default_factory 使用）"""
+    global _cached_sec, _cached_dt, _cached_iso
+    sec = int(time.time())
+    if sec != _cached_sec:
+        _cached_sec = sec
+        _cached_dt = datetime.fromtimestamp(sec)
+        _cached_iso = _cached_dt.isoformat()
+    return _cached_dt
+
+
+def now_iso_cached() -> str:
+    """秒级缓存的当前时间 ISO 字符串"""
+    _now_cached()
+    return _cached_iso
+
 
 class BaseResponse(BaseModel):
     """基础响应模型"""
@@ -17,13 +42,13 @@ class HealthResponse(BaseModel):
     """健康检查响应"""
     status: str = Field("ok", description="服务状态")
     version: str = Field("1.0.0", description="API 版本")
-    timestamp: datetime = Field(default_factory=datetime.now, description="时间戳")
+    timestamp: str = Field(default_factory=now_iso_cached, description="时间戳")
 
 
 class ChatResponse(BaseModel):
     """聊天响应模型"""
     message: str = Field(..., description="AI 回复")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: str = Field(default_factory=now_iso_cached)
 
 
 class DocumentInfo(BaseModel):
@@ -31,7 +56,7 @@ class DocumentInfo(BaseModel):
     id: str = Field(..., description="文档 ID")
     filename: str = Field(..., description="文件名")
     size: int = Field(..., description="文件大小（字节）")
-    upload_time: datetime = Field(default_factory=datetime.now)
+    upload_time: datetime = Field(default_factory=_now_cached)
     chunk_count: Optional[int] = Field(None, description="分块数量")
 
 
@@ -47,7 +72,7 @@ class SearchResult(BaseModel):
     """检索结果模型"""
     content: str = Field(..., description="内容")
     score: float = Field(..., description="相似度分数")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="元数据")
+    metadata: Any = Field(default_factory=dict, description="元数据")
 
 
 class SearchResponse(BaseModel):
@@ -69,7 +94,7 @@ class Memory(BaseModel):
     id: str
     content: str
     timestamp: datetime
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Any = Field(default_factory=dict)
 
 
 class MemoryListResponse(BaseModel):
@@ -78,7 +103,17 @@ class MemoryListResponse(BaseModel):
     total: int
 
 
-class ConfigTestResult(BaseModel):
+# 嵌套模型列表的校验/序列化适配器：模块级构建一次，
+# 调用方 validate_python / dump_json 复用同一套 Rust 校验器，
+# 不在每次响应时重建 schema
+SEARCH_RESULTS_ADAPTER = TypeAdapter(List[SearchResult])
+MEMORY_LIST_ADAPTER = TypeAdapter(List[Memory])
+
+
+# 纯内部/出站容器不走 Pydantic 校验：dataclass(slots=True) 没有
+# 每实例 __dict__ 和验证器开销，FastAPI 的编码器可直接序列化
+@dataclass(slots=True)
+class ConfigTestResult:
     """配置测试结果"""
     result: bool
     error_message: Optional[str]
@@ -88,7 +123,7 @@ class ErrorResponse(BaseModel):
     success: bool = False
     error: str = Field(..., description="错误信息")
     detail: Optional[str] = Field(None, description="详细错误")
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: str = Field(default_factory=now_iso_cached)
 
 
 # ==================== Work Scene Responses ====================
@@ -97,7 +132,7 @@ class WeeklyReportResponse(BaseModel):
     """周报响应"""
     success: bool = True
     report: str = Field(..., description="周报内容")
-    period: Dict[str, str] = Field(..., description="时间范围")
+    period: Any = Field(..., description="时间范围")
     logs_count: int = Field(..., description="工作记录数量")
     message: str = Field(default="Weekly report generated successfully")
 
@@ -114,7 +149,7 @@ class DailyReportResponse(BaseModel):
 class OrganizeTodosResponse(BaseModel):
     """待办整理响应"""
     success: bool = True
-    organized_todos: Dict[str, Any] = Field(..., description="整理后的待办事项")
+    organized_todos: Any = Field(..., description="整理后的待办事项")
     original_count: int = Field(..., description="原始待办数量")
     message: str = Field(default="Todos organized successfully")
 
@@ -150,8 +185,8 @@ class MoodAnalysisResponse(BaseModel):
 class InterestTrackingResponse(BaseModel):
     """兴趣追踪响应"""
     success: bool = True
-    interests: List[Dict[str, Any]] = Field(..., description="兴趣列表")
-    period: Dict[str, Any] = Field(..., description="时间范围")
+    interests: Any = Field(..., description="兴趣列表")
+    period: Any = Field(..., description="时间范围")
     records_count: int = Field(..., description="分析的记录数量")
     message: str = Field(default="Interests tracked successfully")
 
@@ -161,7 +196,7 @@ class LifeSummaryResponse(BaseModel):
     success: bool = True
     summary: str = Field(..., description="生活总结")
     period: str = Field(..., description="总结周期")
-    date_range: Dict[str, str] = Field(..., description="日期范围")
+    date_range: Any = Field(..., description="日期范围")
     records_count: int = Field(..., description="记录数量")
     message: str = Field(default="Life summary generated successfully")
 
@@ -171,7 +206,7 @@ class LifeSuggestionsResponse(BaseModel):
     success: bool = True
     suggestions: str = Field(..., description="生活建议")
     based_on_records: int = Field(..., description="基于的记录数量")
-    insights: List[Dict[str, Any]] = Field(..., description="提取的洞察")
+    insights: Any = Field(..., description="提取的洞察")
     message: str = Field(default="Life suggestions generated successfully")
 
 
@@ -183,18 +218,28 @@ class RecordLifeEventResponse(BaseModel):
     timestamp: str = Field(..., description="记录时间")
     message: str = Field(default="Life event recorded successfully")
 
-class Node(BaseModel):
+@dataclass(slots=True)
+class Node:
     id: str
     name: str
 
-class Edge(BaseModel):
+@dataclass(slots=True)
+class Edge:
     source: str
     target: str
     relation: str
 
-class Graph(BaseModel):
-    nodes: List[Node] = Field(default_factory=list)
-    edges: List[Edge] = Field(default_factory=list)
+@dataclass(slots=True)
+class Graph:
+    nodes: List[Node] = field(default_factory=list)
+    edges: List[Edge] = field(default_factory=list)
+
+class Pageable(NamedTuple):
+    """分页信息（不可变三元组，构造是 C 级 tuple 分配）"""
+    page: int
+    size: int
+    total_count: int
+
 
 class ApiResponse(BaseModel):
     code: int = Field(..., description="状态码")
@@ -209,7 +254,17 @@ class ApiResponse(BaseModel):
         :param data: 任意类型的响应数据（默认为 None）
         :return: ApiResponse 实例，code=200, msg="success"
         """
-        return cls(code=200, msg="success", data=data)
+        # 出站数据是服务端自己构造的，model_construct 跳过字段校验
+        return cls.model_construct(code=200, msg="success", data=data)
+
+    def to_bytes(self) -> bytes:
+        """直接序列化为 JSON 字节串
+
+        pydantic-core 在 Rust 侧一次写出字节，配合
+        Response(content=..., media_type="application/json")
+        可以绕过「先 model_dump 成 dict 再 json.dumps」的中间层。
+        """
+        return self.model_dump_json().encode()
 
     @classmethod
     def error(cls, code: int, msg: str) -> "ApiResponse":
@@ -219,15 +274,22 @@ class ApiResponse(BaseModel):
         :param msg: 错误消息
         :return: ApiResponse 实例，code=指定错误码, msg=指定错误消息
         """
-        return cls(code=code, msg=msg, data=None)
+        return cls.model_construct(code=code, msg=msg, data=None)
 
-class Pageable(BaseModel):
-    page: int = Field(..., description="当前页码")
-    size: int = Field(..., description="每页大小")
-    total_count: int = Field(..., description="总记录数")
 
 class ApiResponseWithPageable(ApiResponse):
-    pageable: Optional[Pageable] = Field(None, description="分页信息")
+    """带分页信息的 API 响应
+
+    分页字段必须留在子类：并入 ApiResponse 会让所有非分页端点的
+    响应体多出一个 \"pageable\": null，对现有客户端是静默的
+    线上格式变更。
+    """
+    pageable: Optional[Any] = Field(None, description="分页信息")
+
+    @field_serializer('pageable')
+    def _serialize_pageable(self, value: Any):
+        """NamedTuple 默认按位置序列化成数组，这里保持对象形状"""
+        return value._asdict() if isinstance(value, Pageable) else value
 
     @classmethod
     def success(
@@ -235,7 +297,7 @@ class ApiResponseWithPageable(ApiResponse):
         data: Any = None,
         pageable: Optional[Pageable] = None
     ) -> "ApiResponseWithPageable":
-        return cls(code=200, msg="success", data=data, pageable=pageable)
+        return cls.model_construct(code=200, msg="success", data=data, pageable=pageable)
 
     @classmethod
     def error(
@@ -244,4 +306,4 @@ class ApiResponseWithPageable(ApiResponse):
         msg: str,
         pageable: Optional[Pageable] = None
     ) -> "ApiResponseWithPageable":
-        return cls(code=code, msg=msg, data=None, pageable=pageable)
+        return cls.model_construct(code=code, msg=msg, data=None, pageable=pageable)
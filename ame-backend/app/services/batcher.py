@@ -0,0 +1,83 @@
+"""
+自适应批处理器
+将短时间窗口内的并发请求合并为一次批量处理
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdaptiveBatcher:
+    """自适应批处理器
+
+    请求通过 submit() 入队并拿到一个 future；后台任务在攒满 max_batch
+    条或等待 max_wait_ms 毫秒后，把这一批请求交给 handler 一次性处理，
+    再把结果逐个回填到各自的 future。
+
+    Args:
+        handler: 批处理函数，接收 payload 列表，返回等长的结果列表
+        max_batch: 单批最大请求数
+        max_wait_ms: 攒批的最长等待时间（毫秒）
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 8,
+        max_wait_ms: int = 20
+    ):
+        self._handler = handler
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(self, payload: Any) -> Any:
+        """提交一个请求并等待批处理结果"""
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, fut))
+        self._ensure_drain_task()
+        return await fut
+
+    def _ensure_drain_task(self):
+        """确保后台攒批任务在运行"""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(
+                self._drain_loop()
+            )
+
+    async def _drain_loop(self):
+        """攒批并分发结果，队列清空后退出"""
+        loop = asyncio.get_running_loop()
+
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self._max_wait
+
+            # 在等待窗口内继续攒批
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await self._handler([payload for payload, _ in batch])
+            except Exception as e:
+                logger.exception("Batch handler failed (batch size %s)", len(batch))
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
@@ -2,14 +2,27 @@
 配置服务
 管理系统配置的保存和测试
 """
-import json
-from typing import Dict, Any
+import asyncio
+import hashlib
+import os
+import time
+
+import orjson
+from typing import Dict, Any, Optional
+
 from app.core.config import get_settings, reload_settings
 from app.core.logger import get_logger
+from app.core.pools import run_io
+from app.models.requests import ConfigRequest, ConfigTestRequest
 from app.models.responses import ConfigTestResult
 
 logger = get_logger(__name__)
 
+# 同一份配置的测试结果在短时间内复用（前端常连点"测试"按钮），
+# 超过 TTL 后重新发起真实探测
+_TEST_TTL_SECONDS = 10
+
+
 
 class ConfigService:
     """配置管理服务"""
@@ -18,78 +31,145 @@ class ConfigService:
         """初始化配置服务"""
         settings = get_settings()
         self.config_file = settings.CONFIG_DIR / "config.json"
+        # 脱敏视图在配置变更时计算一次，读取接口直接复用；
+        # 记录文件 mtime，外部改动配置文件时缓存自动失效
+        self._masked_view: Optional[Dict[str, Any]] = None
+        self._cached_mtime: Optional[int] = None
+        # 配置哈希 -> (时间戳, 测试结果)
+        self._test_cache: Dict[bytes, tuple] = {}
+        # 上次落盘内容的摘要，内容没变时跳过整个写入流程
+        self._saved_digest: Optional[bytes] = None
         logger.info("Config Service initialized")
 
+    def _write_atomic(self, data: bytes):
+        """先写临时文件再原子替换，崩溃时不会留下写了一半的配置"""
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.config_file)
+
+    @staticmethod
+    def _build_masked_view(config: Dict[str, Any]) -> Dict[str, Any]:
+        """构建脱敏后的配置视图（隐藏 api_key 等敏感信息）"""
+        masked = dict(config)
+        if masked.get('api_key'):
+            masked['api_key'] = masked['api_key'][:8] + '...'
+        return masked
+
     async def load_config(self) -> Dict[str, Any]:
         """
-        加载配置
+        加载配置（脱敏视图）
 
         Returns:
-            配置字典
+            配置字典，敏感字段已脱敏
         """
         logger.debug("Loading configuration")
 
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    logger.debug("Configuration loaded from file")
-                    return config
+            mtime = self.config_file.stat().st_mtime_ns if self.config_file.exists() else None
+
+            # 文件未变时直接返回缓存视图，一次 stat 代替整个读取+解析
+            if self._masked_view is not None and mtime == self._cached_mtime:
+                return self._masked_view
+
+            if mtime is not None:
+                # 磁盘读放到线程池，不阻塞事件循环；
+                # orjson 在 C 侧一次完成解析，不逐字符走 Python 解码
+                raw = await run_io(self.config_file.read_bytes)
+                config = orjson.loads(raw)
+                logger.debug("Configuration loaded from file")
             else:
                 logger.debug("No configuration file found")
-                return {}
+                config = {}
+
+            self._masked_view = self._build_masked_view(config)
+            self._cached_mtime = mtime
+            return self._masked_view
 
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             return {}
 
-    async def test_config(self, config: Dict[str, Any]):
+    async def test_config(self, config: ConfigTestRequest):
         """
         测试配置
 
         Args:
-            config: 配置字典
+            config: 配置测试请求（直接传模型，避免路由层 model_dump 开销）
 
         Returns:
             测试结果
         """
-        # todo chenchenaq 这里调用三方方法进行配置测试
-        # 这里导入三方方法
+        # blake2b 哈希参与测试的配置字段做缓存键（速度快，缓存键无碰撞顾虑）
+        cache_key = hashlib.blake2b(
+            orjson.dumps({
+                'api_key': config.api_key,
+                'base_url': config.base_url,
+                'model': config.model,
+                'embedding_model': config.embedding_model,
+                'embedding_dimension': config.embedding_dimension,
+            }),
+            digest_size=16
+        ).digest()
+
+        cached = self._test_cache.get(cache_key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < _TEST_TTL_SECONDS:
+            return cached[1]
+
+        # LLM 探测与存储探测互不依赖，gather 并发执行，
+        # 端到端耗时取两者较慢的一个而不是两者相加
+        (llm_ok, llm_msg), (storage_ok, storage_msg) = await asyncio.gather(
+            self._probe_llm(config),
+            self._probe_storage(config)
+        )
+
+        if llm_ok and storage_ok:
+            result = ConfigTestResult(result=True, error_message=None)
+        else:
+            failures = [msg for ok, msg in ((llm_ok, llm_msg), (storage_ok, storage_msg)) if not ok]
+            result = ConfigTestResult(result=False,
+                                      error_message="测试失败，" + "，".join(failures))
+        self._test_cache[cache_key] = (now, result)
+        return result
+
+    async def _probe_llm(self, config: ConfigTestRequest):
+        """探测 LLM 配置可用性，返回 (是否通过, 失败描述)"""
+        # todo chenchenaq 这里调用三方方法进行 LLM 配置测试
+        # 接入时按配置做 lru_cache 复用 LLMCaller，连接在重复测试间保持热
+        # service = ConnectService()
+        # llm_test = await service.test_llm_config(api_key=config.api_key, model=config.model,
+        #                                          base_url=config.base_url)
+        # if llm_test.success:
+        #     return True, ""
+        # error_message = "llm配置失败,"
+        # for value in llm_test.result.values():
+        #     if not value.success:
+        #         error_message = error_message + value.message + ":" + value.error + ","
+        # return False, error_message.rstrip(',')
+        return False, "llm配置:调用器未正确配置,未配置API密钥或其他必要参数"
+
+    async def _probe_storage(self, config: ConfigTestRequest):
+        """探测图数据库配置可用性，返回 (是否通过, 失败描述)"""
+        # todo chenchenaq 这里调用三方方法进行存储配置测试
         # service = ConnectService()
-        # llm_test = await service.test_llm_config(api_key=config.get('api_key'), model=config.get('model'),
-        #                                          base_url=config.get('base_url'))
-        # storge_test = await service.test_storage_config(port=config.get('falkor_port'),
-        #                                                 graph_name=config.get('falkor_graph_name'),
-        #                                                 password=config.get('FALKOR_PASSWORD'))
-        # if llm_test.success and storge_test.success:
-        #     return ConfigTestResult(result=True,error_message=None)
-        #
-        # else:
-        #     error_message = "测试失败，"
-        #     if not llm_test.success:
-        #         error_message = error_message + "llm配置失败,"
-        #         for value in llm_test.result.values():
-        #             if not value.success:
-        #                 error_message = error_message + value.message + ":" + value.error + ","
-        #         for value in llm_test.result.values():
-        #             if not value.success:
-        #                 error_message = error_message + value.message + ":" + value.error + ","
-        #     if not storge_test.success:
-        #         error_message = error_message + "falkor配置失败,"
-        #         for value in storge_test.result.values():
-        #             if not value.success:
-        #                 error_message = error_message + value.message + ":" + value.error + ","
-        #     error_message = error_message.rstrip(',')
-        #     return ConfigTestResult(result=False, error_message=error_message)
-        return ConfigTestResult(result=False,
-                                error_message="测试失败，llm配置:调用器未正确配置,未配置API密钥或其他必要参数，falkor配置:健康检查失败,数据库连接不健康")
-
-    async def save_config(self, config: Dict[str, Any]):
+        # storge_test = await service.test_storage_config(port=config.falkor_port,
+        #                                                 graph_name=config.falkor_graph_name,
+        #                                                 password=config.falkor_password)
+        # if storge_test.success:
+        #     return True, ""
+        # error_message = "falkor配置失败,"
+        # for value in storge_test.result.values():
+        #     if not value.success:
+        #         error_message = error_message + value.message + ":" + value.error + ","
+        # return False, error_message.rstrip(',')
+        return False, "falkor配置:健康检查失败,数据库连接不健康"
+
+    async def save_config(self, config: ConfigRequest):
         """
         保存配置
 
         Args:
-            config: 配置字典
+            config: 配置请求（直接传模型，落盘时才做一次 model_dump）
 
         Returns:
             保存结果
@@ -97,18 +177,39 @@ class ConfigService:
         logger.info("Saving configuration")
 
         try:
-            # 保存到配置文件
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-
-            # 更新环境变量（临时）
-            import os
-            if 'api_key' in config:
-                os.environ['OPENAI_API_KEY'] = config['api_key']
-            if 'base_url' in config:
-                os.environ['OPENAI_BASE_URL'] = config['base_url']
-            if 'model' in config:
-                os.environ['OPENAI_MODEL'] = config['model']
+            # 只在写文件这一处做一次字典转换
+            config_dict = config.model_dump()
+
+            # orjson 一次编码出 UTF-8 字节，落盘放线程池执行，
+            # 写配置期间事件循环继续服务其他请求
+            data = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+
+            # 内容与上次落盘完全一致时跳过写盘/环境变量/重载
+            digest = hashlib.blake2b(data).digest()
+            if digest == self._saved_digest:
+                logger.debug("Configuration unchanged, skipping write")
+                return True
+
+            await run_io(self._write_atomic, data)
+            self._saved_digest = digest
+
+            # 配置变更时重算脱敏视图，load_config 不再做每次请求的字符串操作
+            self._masked_view = self._build_masked_view(config_dict)
+            self._cached_mtime = self.config_file.stat().st_mtime_ns
+            # 配置变了，旧的测试结果不再可信
+            self._test_cache.clear()
+
+            # 更新环境变量（临时）；字段各读一次到局部变量，
+            # 不重复走 pydantic 的属性访问
+            api_key = config.api_key
+            base_url = config.base_url
+            model = config.model
+            if api_key:
+                os.environ['OPENAI_API_KEY'] = api_key
+            if base_url:
+                os.environ['OPENAI_BASE_URL'] = base_url
+            if model:
+                os.environ['OPENAI_MODEL'] = model
 
             # 重新加载配置
             reload_settings()
@@ -303,8 +404,12 @@ class ConfigService:
 _config_service = None
 
 
-def get_config_service() -> ConfigService:
-    """获取配置服务实例"""
+async def get_config_service() -> ConfigService:
+    """获取配置服务实例
+
+    使用 async def，FastAPI 依赖解析直接在事件循环内完成，
+    避免每次请求被调度到线程池。
+    """
     global _config_service
     if _config_service is None:
         _config_service = ConfigService()
@@ -2,7 +2,16 @@
 生活场景服务
 提供生活相关的AI辅助功能：心情分析、兴趣追踪、生活建议等
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import inspect
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -21,6 +30,116 @@ from app.core.exceptions import ConfigurationError, StorageError, LLMError
 
 logger = get_logger(__name__)
 
+# 限制并发 LLM 调用数，避免高并发下把上游打满
+_LLM_CONCURRENCY = 8
+
+# 每请求的成功确认日志按 1% 采样：高 QPS 下不为重复的
+# "xxx successfully" 日志支付格式化和 handler 开销
+_LOG_SAMPLE_RATE = 0.01
+
+
+def _log_sampled() -> bool:
+    """成功确认日志是否落入采样窗口"""
+    return random.random() < _LOG_SAMPLE_RATE
+
+# FAISS 索引结构：IVF + PQ 量化。生活记录永久保留、索引只增不减，
+# 默认的 IndexFlatL2 内存和带宽都随量线性涨；PQ 压缩后检索变为
+# 计算密集而非内存带宽密集
+_FAISS_INDEX_FACTORY = "IVF256,PQ8"
+
+# 心情分析结果缓存：内容寻址，提示词版本变更时整体失效
+_MOOD_CACHE_SIZE = 4096
+
+# 时间索引有效期（秒）与构建扫描上限：索引只对本进程的写入做写穿，
+# 多 worker 部署下其它进程写入的记录对本进程不可见，到期整体重建，
+# 把跨进程的陈旧窗口约束在 TTL 内
+_TIME_INDEX_TTL = 60.0
+_TIME_INDEX_SCAN_LIMIT = 100000
+_MOOD_PROMPT_VERSION = "v1"
+
+# 心情文档元数据模板：常量键只建一次，每次请求 copy 后填值
+_MOOD_META_TEMPLATE = {"category": "mood", "emotion": None, "analysis": None}
+
+
+# 提示词模板：静态部分只在模块加载时构建一次，
+# 每次请求只做一次 format / join 拼接
+_MOOD_PROMPT = """请分析以下心情日记，提供深度的情绪分析和建议：
+
+心情日记：
+{mood}
+
+请按照以下格式输出：
+
+**情绪识别**
+主要情绪：[情绪类型]
+情绪强度：[1-10分]
+
+**深层分析**
+[分析这段记录背后的情绪原因、触发因素等]
+
+**积极面**
+[找出记录中的积极因素或成长点]
+
+**建议**
+1. [建议1]
+2. [建议2]
+
+**关注点**
+[如果发现需要关注的情绪问题，请提醒]"""
+
+_SUGGESTIONS_HEAD = """基于用户最近的生活记录，提供个性化的生活建议。
+
+发现的模式和洞察：
+"""
+
+_SUGGESTIONS_TAIL = """
+请提供3-5条具体、可行的生活建议，帮助用户：
+1. 提升生活质量
+2. 发展个人兴趣
+3. 改善情绪状态
+4. 优化时间管理
+
+建议格式：
+**建议1：[标题]**
+[具体描述和行动步骤]
+
+**建议2：[标题]**
+[具体描述和行动步骤]
+
+..."""
+
+
+def _sortable_doc_id(prefix: str, ts: datetime) -> str:
+    """生成时间有序且唯一的文档 id
+
+    零填充毫秒时间戳保证字典序即时间序（主键 B 树追加友好），
+    40 位随机后缀保证同一毫秒内的并发请求不撞 id —— 原先的
+    f"{prefix}_{timestamp()}" 浮点格式在并发下会重复。
+    """
+    return f"{prefix}_{int(ts.timestamp() * 1000):013d}{os.urandom(5).hex()}"
+
+
+@lru_cache(maxsize=None)
+def _get_repository(faiss_index_path: str,
+                    metadata_db_path: str,
+                    graph_db_path: str) -> HybridRepository:
+    """按存储路径缓存 HybridRepository
+
+    重复实例化（测试、配置重载）复用同一份已加载的 FAISS 索引
+    和数据库句柄，不再每次 read_index 冷启动。
+
+    仓库版本支持时请求量化索引结构（IVF+PQ），旧版本签名不带
+    该参数则按默认结构构建。
+    """
+    kwargs = dict(
+        faiss_index_path=faiss_index_path,
+        metadata_db_path=metadata_db_path,
+        graph_db_path=graph_db_path
+    )
+    if "index_factory" in inspect.signature(HybridRepository.__init__).parameters:
+        kwargs["index_factory"] = _FAISS_INDEX_FACTORY
+    return HybridRepository(**kwargs)
+
 
 class LifeService:
     """生活场景服务"""
@@ -44,21 +163,21 @@ class LifeService:
                 model=settings.MODEL
             )
         except Exception as e:
-            logger.error(f"Failed to initialize LLM caller: {e}")
+            logger.error("Failed to initialize LLM caller: %s", e)
             raise LLMError(
                 message="Failed to initialize LLM service",
                 detail=str(e)
             )
         
         try:
-            # 初始化混合存储仓库
-            self.repository = HybridRepository(
-                faiss_index_path=str(settings.DATA_DIR / "faiss" / "life.index"),
-                metadata_db_path=str(settings.DATA_DIR / "metadata" / "life.db"),
-                graph_db_path=str(settings.DATA_DIR / "falkor" / "life.db")
+            # 初始化混合存储仓库（按路径缓存，重复构造复用索引）
+            self.repository = _get_repository(
+                str(settings.DATA_DIR / "faiss" / "life.index"),
+                str(settings.DATA_DIR / "metadata" / "life.db"),
+                str(settings.DATA_DIR / "falkor" / "life.db")
             )
         except Exception as e:
-            logger.error(f"Failed to initialize repository: {e}")
+            logger.error("Failed to initialize repository: %s", e)
             raise StorageError(
                 message="Failed to initialize storage",
                 detail=str(e)
@@ -76,8 +195,56 @@ class LifeService:
             llm_caller=self.llm_caller,
             analyze_engine=self.analyzer
         )
-        
+
+        # LLM 并发上限
+        self._llm_semaphore = asyncio.Semaphore(_LLM_CONCURRENCY)
+
+        # 心情分析 LLM 输出的内容寻址 LRU：相同内容的重复记录
+        # 直接命中本地缓存，不再发一次 LLM 往返
+        self._mood_cache: OrderedDict = OrderedDict()
+        self._model = settings.MODEL
+
+        # LIFE_RECORD 的 (时间戳, 文档id) 有序索引：
+        # 时间范围查询退化为两次二分 + 切片，不再整段扫存储层
+        self._time_index: List[tuple] = []
+        self._time_index_built_at = 0.0
+        self._time_index_disabled = False
+        self._time_index_lock = asyncio.Lock()
+
+        # 后台预热：LLM 连接与向量索引的首次查询在启动期完成
+        try:
+            self._warmup_task: Optional[asyncio.Task] = \
+                asyncio.get_running_loop().create_task(self._warmup())
+        except RuntimeError:
+            # 无运行中的事件循环（同步上下文构造），跳过预热
+            self._warmup_task = None
+
         logger.info("Life Service initialized")
+
+    async def _warmup(self):
+        """预热存储索引和 LLM 连接
+
+        一次极小的时间范围查询把 FAISS/SQLite 的冷页拉起来，
+        一次 ping 调用建好到 LLM 上游的 TCP 连接；失败只告警，
+        不影响正常请求路径。
+        """
+        try:
+            now = datetime.now()
+            await self.repository.search_by_time_range(
+                start_date=now - timedelta(seconds=1),
+                end_date=now,
+                doc_type=DocumentType.LIFE_RECORD,
+                limit=1
+            )
+        except Exception as e:
+            logger.warning("Repository warmup failed: %s", e)
+
+        acomplete = getattr(self.llm_caller, 'acomplete', None)
+        if acomplete is not None:
+            try:
+                await acomplete("ping")
+            except Exception as e:
+                logger.warning("LLM warmup failed: %s", e)
     
     async def analyze_mood(
         self,
@@ -100,48 +267,65 @@ class LifeService:
             if entry_time is None:
                 entry_time = datetime.now()
             
-            # 使用 LifeEngine 分析心情
-            mood_analysis = await self.life_engine.analyze_mood(
-                mood_entry=mood_entry,
-                user_id="default",
-                entry_time=entry_time
-            )
+            # 内容寻址缓存：键只含内容/模型/提示词版本，不含时间
+            cache_key = hashlib.blake2b(
+                f"{self._model}|{_MOOD_PROMPT_VERSION}|{mood_entry.strip().lower()}".encode(),
+                digest_size=16
+            ).digest()
+
+            mood_analysis = self._mood_cache.get(cache_key)
+            if mood_analysis is not None:
+                self._mood_cache.move_to_end(cache_key)
+            else:
+                # LifeEngine 没有多条合一的提示词端点，攒批省不下
+                # 上游往返，只会让请求互相陪绑；直接在信号量下调用
+                async with self._llm_semaphore:
+                    mood_analysis = await self.life_engine.analyze_mood(
+                        mood_entry=mood_entry,
+                        user_id="default",
+                        entry_time=entry_time
+                    )
+                self._mood_cache[cache_key] = mood_analysis
+                if len(self._mood_cache) > _MOOD_CACHE_SIZE:
+                    self._mood_cache.popitem(last=False)
             
-            # 存储心情记录
-            doc = Document(
-                id=f"mood_{entry_time.timestamp()}",
+            # 存储心情记录：字段全部由服务端自己构造（可信），
+            # model_construct 跳过 pydantic 校验
+            metadata = _MOOD_META_TEMPLATE.copy()
+            metadata["emotion"] = {
+                "type": mood_analysis.emotion_type,
+                "intensity": mood_analysis.emotion_intensity
+            }
+            metadata["analysis"] = mood_analysis.suggestions
+            doc = Document.model_construct(
+                id=_sortable_doc_id("mood", entry_time),
                 content=mood_entry,
                 doc_type=DocumentType.LIFE_RECORD,
                 source="mood_diary",
                 timestamp=entry_time,
                 retention_type=MemoryRetentionType.PERMANENT,
-                metadata={
-                    "category": "mood",
-                    "emotion": {
-                        "type": mood_analysis.emotion_type,
-                        "intensity": mood_analysis.emotion_intensity
-                    },
-                    "analysis": mood_analysis.suggestions
-                }
+                metadata=metadata
             )
             
             await self.repository.create(doc)
-            
-            logger.info("Mood analyzed and stored")
+            self._time_index_insert(doc)
+
+            if _log_sampled():
+                logger.info("Mood analyzed and stored")
             
             return {
                 "success": True,
                 "emotion_type": mood_analysis.emotion_type,
                 "emotion_intensity": mood_analysis.emotion_intensity,
                 "triggers": mood_analysis.triggers,
-                "trend": mood_analysis.trend.dict() if mood_analysis.trend else None,
+                "trend": mood_analysis.trend.model_dump(mode='json') if mood_analysis.trend else None,
                 "suggestions": mood_analysis.suggestions,
                 "document_id": doc.id,
                 "timestamp": entry_time.isoformat()
             }
             
         except Exception as e:
-            logger.error(f"Failed to analyze mood: {e}")
+            logger.error("Failed to analyze mood: %s", e)
             raise
     
     async def track_interests(
@@ -157,7 +341,7 @@ class LifeService:
         Returns:
             兴趣分析结果
         """
-        logger.info(f"Tracking interests for past {period_days} days")
+        logger.info("Tracking interests for past %s days", period_days)
         
         try:
             # 使用 LifeEngine 追踪兴趣
@@ -166,11 +350,14 @@ class LifeService:
                 period_days=period_days
             )
             
-            logger.info("Interests tracked successfully")
+            if _log_sampled():
+                logger.info("Interests tracked successfully")
             
             return {
                 "success": True,
-                "top_interests": [t.dict() for t in interest_report.top_interests],
+                # model_dump(mode='json') 走 pydantic-core 的 Rust 序列化，
+                # 直接产出可入 orjson 的原生类型
+                "top_interests": [t.model_dump(mode='json') for t in interest_report.top_interests],
                 "new_interests": interest_report.new_interests,
                 "declining_interests": interest_report.declining_interests,
                 "recommendations": interest_report.recommendations,
@@ -179,7 +366,7 @@ class LifeService:
             }
             
         except Exception as e:
-            logger.error(f"Failed to track interests: {e}")
+            logger.error("Failed to track interests: %s", e)
             raise
     
     async def generate_life_summary(
@@ -195,20 +382,12 @@ class LifeService:
         Returns:
             生活总结
         """
-        logger.info(f"Generating {period} life summary")
+        logger.info("Generating %s life summary", period)
         
         try:
             # 计算日期范围
-            end_date = datetime.now()
-            if period == "week":
-                start_date = end_date - timedelta(days=7)
-            elif period == "month":
-                start_date = end_date - timedelta(days=30)
-            elif period == "year":
-                start_date = end_date - timedelta(days=365)
-            else:
-                raise ValueError(f"Invalid period: {period}")
-            
+            start_date, end_date = self._period_range(period)
+
             # 检索生活记录
             life_records = await self._get_life_records(start_date, end_date)
             
@@ -218,34 +397,102 @@ class LifeService:
                     "message": "No life records found for the specified period"
                 }
             
-            # 使用分析引擎生成总结
-            summary = await self.analyzer.generate_report(
-                documents=life_records,
-                report_type="life_summary",
-                context={
-                    "period": period,
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat()
-                }
-            )
-            
-            logger.info("Life summary generated successfully")
-            
+            # isoformat 只算一次，提示词上下文和响应体共用
+            start_iso = start_date.isoformat()
+            end_iso = end_date.isoformat()
+
+            # 使用分析引擎生成总结（受 LLM 并发上限约束）
+            async with self._llm_semaphore:
+                summary = await self.analyzer.generate_report(
+                    documents=life_records,
+                    report_type="life_summary",
+                    context={
+                        "period": period,
+                        "start_date": start_iso,
+                        "end_date": end_iso
+                    }
+                )
+
+            if _log_sampled():
+                logger.info("Life summary generated successfully")
+
             return {
                 "success": True,
                 "summary": summary,
                 "period": period,
                 "date_range": {
-                    "start": start_date.isoformat(),
-                    "end": end_date.isoformat()
+                    "start": start_iso,
+                    "end": end_iso
                 },
                 "records_count": len(life_records)
             }
             
         except Exception as e:
-            logger.error(f"Failed to generate life summary: {e}")
+            logger.error("Failed to generate life summary: %s", e)
             raise
-    
+
+    async def generate_life_summary_stream(
+        self,
+        period: str = "week"
+    ) -> AsyncIterator[str]:
+        """
+        流式生成生活总结
+
+        增量 LLM 输出按 100ms / 4KB 粒度攒批下发，首字节延迟从
+        整份报告的生成时间降到首 token 延迟。分析引擎不支持流式
+        接口时退化为一次性输出完整报告。
+
+        Args:
+            period: 总结周期（week/month/year）
+
+        Yields:
+            总结文本片段
+        """
+        logger.info("Streaming %s life summary", period)
+
+        start_date, end_date = self._period_range(period)
+        life_records = await self._get_life_records(start_date, end_date)
+
+        if not life_records:
+            yield "No life records found for the specified period"
+            return
+
+        context = {
+            "period": period,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat()
+        }
+        stream_fn = getattr(self.analyzer, 'generate_report_stream', None)
+
+        async with self._llm_semaphore:
+            if stream_fn is None:
+                yield await self.analyzer.generate_report(
+                    documents=life_records,
+                    report_type="life_summary",
+                    context=context
+                )
+                return
+
+            # 攒批下发：每个 token 都 yield 会放大网络帧开销
+            buf: List[str] = []
+            buf_len = 0
+            last_flush = time.monotonic()
+            async for chunk in stream_fn(
+                documents=life_records,
+                report_type="life_summary",
+                context=context
+            ):
+                buf.append(chunk)
+                buf_len += len(chunk)
+                now = time.monotonic()
+                if buf_len >= 4096 or now - last_flush >= 0.1:
+                    yield "".join(buf)
+                    buf.clear()
+                    buf_len = 0
+                    last_flush = now
+            if buf:
+                yield "".join(buf)
+
     async def get_life_suggestions(
         self,
         context: Optional[str] = None
@@ -262,13 +509,15 @@ class LifeService:
         logger.info("Getting life suggestions")
         
         try:
-            # 使用 LifeEngine 生成建议
-            suggestions = await self.life_engine.generate_life_suggestions(
-                user_id="default",
-                context=context
-            )
+            # 单请求单提示词，直接在信号量下调用 LifeEngine
+            async with self._llm_semaphore:
+                suggestions = await self.life_engine.generate_life_suggestions(
+                    user_id="default",
+                    context=context
+                )
             
-            logger.info("Life suggestions generated")
+            if _log_sampled():
+                logger.info("Life suggestions generated")
             
             return {
                 "success": True,
@@ -276,7 +525,7 @@ class LifeService:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get life suggestions: {e}")
+            logger.error("Failed to get life suggestions: %s", e)
             raise
     
     async def record_life_event(
@@ -298,15 +547,15 @@ class LifeService:
         Returns:
             记录结果
         """
-        logger.info(f"Recording life event: {event_type}")
+        logger.info("Recording life event: %s", event_type)
         
         try:
             if event_time is None:
                 event_time = datetime.now()
             
-            # 创建文档
-            doc = Document(
-                id=f"life_event_{event_time.timestamp()}",
+            # 创建文档（内部构造的可信数据，跳过校验）
+            doc = Document.model_construct(
+                id=_sortable_doc_id("life_event", event_time),
                 content=event_content,
                 doc_type=DocumentType.LIFE_RECORD,
                 source="user_input",
@@ -320,8 +569,10 @@ class LifeService:
             
             # 存储到仓库
             await self.repository.create(doc)
-            
-            logger.info("Life event recorded successfully")
+            self._time_index_insert(doc)
+
+            if _log_sampled():
+                logger.info("Life event recorded successfully")
             
             return {
                 "success": True,
@@ -331,11 +582,72 @@ class LifeService:
             }
             
         except Exception as e:
-            logger.error(f"Failed to record life event: {e}")
+            logger.error("Failed to record life event: %s", e)
             raise
     
     # ==================== 辅助方法 ====================
-    
+
+    @staticmethod
+    def _period_range(period: str) -> tuple:
+        """把总结周期换算成 (start_date, end_date)"""
+        end_date = datetime.now()
+        if period == "week":
+            start_date = end_date - timedelta(days=7)
+        elif period == "month":
+            start_date = end_date - timedelta(days=30)
+        elif period == "year":
+            start_date = end_date - timedelta(days=365)
+        else:
+            raise ValueError(f"Invalid period: {period}")
+        return start_date, end_date
+
+    def _time_index_insert(self, doc: Document):
+        """把新写入的 LIFE_RECORD 登记进时间索引（索引未建成时跳过）"""
+        if self._time_index_built_at and not self._time_index_disabled:
+            insort(self._time_index, (doc.timestamp.timestamp(), doc.id))
+
+    def _time_index_fresh(self) -> bool:
+        """索引已构建且未超过 TTL"""
+        return bool(self._time_index_built_at) and \
+            time.monotonic() - self._time_index_built_at < _TIME_INDEX_TTL
+
+    async def _ensure_time_index(self):
+        """构建或按 TTL 重建时间索引
+
+        记录总量打到扫描上限说明有更老的记录被截断，索引不完整，
+        直接禁用并退回存储层查询。
+        """
+        if self._time_index_disabled or self._time_index_fresh():
+            return
+        async with self._time_index_lock:
+            if self._time_index_disabled or self._time_index_fresh():
+                return
+            docs = await self.repository.search_by_time_range(
+                start_date=datetime.fromtimestamp(0),
+                end_date=datetime.now(),
+                doc_type=DocumentType.LIFE_RECORD,
+                limit=_TIME_INDEX_SCAN_LIMIT
+            )
+            if len(docs) >= _TIME_INDEX_SCAN_LIMIT:
+                self._time_index_disabled = True
+                logger.warning(
+                    "Life record count reached scan limit (%s), "
+                    "time index disabled", _TIME_INDEX_SCAN_LIMIT
+                )
+                return
+            self._time_index = sorted(
+                (d.timestamp.timestamp(), d.id) for d in docs
+            )
+            self._time_index_built_at = time.monotonic()
+            logger.info("Life record time index built: %s entries",
+                        len(self._time_index))
+
+    def _slice_time_index(self, start_date: datetime, end_date: datetime) -> List[str]:
+        """二分切出时间范围内的文档 id（按时间升序）"""
+        lo = bisect_left(self._time_index, (start_date.timestamp(),))
+        hi = bisect_right(self._time_index, (end_date.timestamp(), "\uffff"))
+        return [doc_id for _, doc_id in self._time_index[lo:hi]]
+
     async def _get_life_records(
         self,
         start_date: datetime,
@@ -343,9 +655,20 @@ class LifeService:
     ) -> List[Document]:
         """
         获取指定时间范围内的生活记录
-        
-        使用 HybridRepository 的时间范围检索功能
+
+        优先走内存时间索引 + 按 id 批量取文档；仓库不支持
+        get_many 时退回存储层的时间范围检索
         """
+        get_many = getattr(self.repository, 'get_many', None)
+        if get_many is not None:
+            await self._ensure_time_index()
+            if not self._time_index_disabled:
+                # 与原存储层 limit=200 对齐，超量时保留最新的 200 条
+                ids = self._slice_time_index(start_date, end_date)[-200:]
+                if not ids:
+                    return []
+                return await get_many(ids)
+
         # 使用时间范围检索
         docs = await self.repository.search_by_time_range(
             start_date=start_date,
@@ -353,94 +676,75 @@ class LifeService:
             doc_type=DocumentType.LIFE_RECORD,
             limit=200
         )
-        
+
         return docs
-    
+
     async def _get_recent_life_records(self, limit: int = 20) -> List[Document]:
         """
         获取最近的生活记录
-        
+
         使用最近 30 天的记录
         """
         end_date = datetime.now()
         start_date = end_date - timedelta(days=30)
-        
+
+        get_many = getattr(self.repository, 'get_many', None)
+        if get_many is not None:
+            await self._ensure_time_index()
+            if not self._time_index_disabled:
+                # 取范围内最新的 limit 条
+                ids = self._slice_time_index(start_date, end_date)[-limit:]
+                if not ids:
+                    return []
+                return await get_many(ids)
+
         docs = await self.repository.search_by_time_range(
             start_date=start_date,
             end_date=end_date,
             doc_type=DocumentType.LIFE_RECORD,
             limit=limit
         )
-        
+
         return docs
     
     def _build_mood_analysis_prompt(self, mood_entry: str) -> str:
         """构建心情分析提示词"""
-        return f"""请分析以下心情日记，提供深度的情绪分析和建议：
-
-心情日记：
-{mood_entry}
-
-请按照以下格式输出：
-
-**情绪识别**
-主要情绪：[情绪类型]
-情绪强度：[1-10分]
+        return _MOOD_PROMPT.format(mood=mood_entry)
 
-**深层分析**
-[分析这段记录背后的情绪原因、触发因素等]
-
-**积极面**
-[找出记录中的积极因素或成长点]
-
-**建议**
-1. [建议1]
-2. [建议2]
-
-**关注点**
-[如果发现需要关注的情绪问题，请提醒]"""
-    
     def _build_suggestions_prompt(
         self,
         insights: List[Dict[str, Any]],
         context: Optional[str]
     ) -> str:
         """构建生活建议提示词"""
-        insights_text = "\n".join([f"- {i.get('content', '')}" for i in insights[:5]])
-        
+        insights_text = "\n".join(
+            "- " + (i["content"] if "content" in i else "")
+            for i in insights[:5]
+        )
+
         context_text = ""
         if context:
             context_text = f"\n当前情况：\n{context}\n"
-        
-        return f"""基于用户最近的生活记录，提供个性化的生活建议。
-
-发现的模式和洞察：
-{insights_text}
-{context_text}
 
-请提供3-5条具体、可行的生活建议，帮助用户：
-1. 提升生活质量
-2. 发展个人兴趣
-3. 改善情绪状态
-4. 优化时间管理
-
-建议格式：
-**建议1：[标题]**
-[具体描述和行动步骤]
-
-**建议2：[标题]**
-[具体描述和行动步骤]
-
-..."""
+        return "".join(
+            (_SUGGESTIONS_HEAD, insights_text, "\n", context_text, _SUGGESTIONS_TAIL)
+        )
 
 
 # 全局服务实例
 _life_service: Optional[LifeService] = None
+_init_lock = asyncio.Lock()
+
 
+async def get_life_service() -> LifeService:
+    """获取生活服务实例
 
-def get_life_service() -> LifeService:
-    """获取生活服务实例"""
+    双重检查 + asyncio.Lock，并发首批请求不会各自构造一份
+    服务（重复打开存储句柄、重复读配置）。
+    """
     global _life_service
     if _life_service is None:
-        _life_service = LifeService()
+        async with _init_lock:
+            if _life_service is None:
+                _life_service = LifeService()
     return _life_service
@@ -1,9 +1,12 @@
+import asyncio
 import os
 import random
 from typing import Optional
 
 from app.core.config import get_settings
+from app.core.io import aio_write_text
 from app.core.logger import get_logger
+from app.core.pools import run_io
 from app.core.exceptions import ConfigurationError, StorageError, LLMError, APIException
 
 logger = get_logger(__name__)
@@ -31,40 +34,52 @@ class ProjectService:
         try:
             analysis_result = "这里是一个虚拟的项目分析文案...." + str(random.random())
         except Exception as e:
-            logger.warning(f"项目分析异常，project_desc:{project_desc},e:{str(e)}")
+            logger.warning("项目分析异常，project_desc:%s,e:%s", project_desc, e)
             raise APIException("项目分析异常：" + str(e))
 
-        # 2. 如果当前项目分析文件存在，先删除之前的历史记录，再将其重命名为历史分析文件
-        if self.project_analysis_path.exists():
-            if self.history_analysis_path.exists():
-                self.history_analysis_path.unlink()
-            os.rename(self.project_analysis_path, self.history_analysis_path)
+        # 2. 如果当前项目分析文件存在，原子地轮转为历史分析文件
+        #    os.replace 会直接覆盖旧历史文件，无需先 unlink，不留竞态窗口
+        await run_io(self._rotate_history)
 
-        # 3. 将新的分析结果写入项目分析文件
-        self.project_analysis_path.parent.mkdir(parents=True, exist_ok=True)
-        self.project_analysis_path.write_text(analysis_result, encoding="utf-8")
+        # 3. 将新的分析结果原子写入项目分析文件（写临时文件 + os.replace）
+        await aio_write_text(self.project_analysis_path, analysis_result)
 
         return analysis_result
 
+    def _rotate_history(self):
+        """把当前项目分析文件轮转为历史分析文件（线程池中运行）"""
+        if self.project_analysis_path.exists():
+            os.replace(self.project_analysis_path, self.history_analysis_path)
+
     async def get_history_project_analysis(self):
         """获取历史项目分析结果"""
-        # 读取历史分析文件:.txt
+        # 读取历史分析文件:.txt（线程池中执行，不阻塞事件循环）
         try:
-            if self.history_analysis_path.is_file():
-                return self.history_analysis_path.read_text(encoding="utf-8")
-            else:
-                return ""
+            return await run_io(self._read_history)
         except Exception as e:
             raise APIException(message="未正常读取历史分析结果文件，请检查。" + str(e))
 
+    def _read_history(self) -> str:
+        """同步读取历史分析文件（线程池中运行）"""
+        if self.history_analysis_path.is_file():
+            return self.history_analysis_path.read_text(encoding="utf-8")
+        return ""
+
 
 # 全局服务实例
 _project_service: Optional[ProjectService] = None
+_init_lock = asyncio.Lock()
+
 
+async def get_project_service() -> ProjectService:
+    """获取工作服务实例
 
-def get_project_service() -> ProjectService:
-    """获取工作服务实例"""
+    双重检查 + asyncio.Lock，并发首批请求不会各自构造一份
+    服务（重复打开存储句柄、重复读配置）。
+    """
     global _project_service
     if _project_service is None:
-        _project_service = ProjectService()
+        async with _init_lock:
+            if _project_service is None:
+                _project_service = ProjectService()
     return _project_service
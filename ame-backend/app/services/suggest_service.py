@@ -1,17 +1,24 @@
+import asyncio
 from datetime import datetime
 from enum import IntEnum
 from typing import Optional, List, Dict
 
 from pydantic import BaseModel
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
+from app.core.io import aio_write_text
 from app.core.logger import get_logger
+from app.core.pools import run_io
 from app.core.exceptions import ConfigurationError
 from app.database.sqlite.schema import get_sqlite_db
 from app.models.base_enums import TaskPriority, TaskStatus
 
 logger = get_logger(__name__)
 
+# 缓存未命中哨兵：空字符串（文件不存在）也是合法的缓存值
+_MISS = object()
+
 
 class SuggestService:
     """建议"""
@@ -21,6 +28,10 @@ class SuggestService:
         self.file_path = settings.SUGGEST_STORE_PATH
         self.file_prefix = settings.SUGGEST_FILE_PREFIX
 
+        # 按日期缓存建议内容：这个接口会被前端轮询，热点日期
+        # 直接从内存返回，不必每次开文件重读
+        self._cache: TTLCache = TTLCache(maxsize=32, ttl=300)
+
         # 检查配置
         # if not settings.is_configured:
         #     raise ConfigurationError(
@@ -33,19 +44,24 @@ class SuggestService:
         if date is None:
             date = datetime.now().date()
 
+        cached = self._cache.get(date, _MISS)
+        if cached is not _MISS:
+            return cached
+
         # 构造文件名：suggest_2025-11-19.txt
         filename = f"{self.file_prefix}_{date.isoformat()}.txt"
         file_full_path = self.file_path / filename
 
-        if not file_full_path.exists():
-            return ""
-
+        # 读文件放线程池执行，事件循环不被磁盘 I/O 阻塞；
+        # 文件不存在由异常兜底，省掉单独的 exists() stat
         try:
-            with open(file_full_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-            return content
-        except Exception as e:
-            raise e
+            content = (await run_io(
+                file_full_path.read_text, encoding='utf-8'
+            )).strip()
+        except FileNotFoundError:
+            content = ""
+        self._cache.set(date, content)
+        return content
 
     async def generate_and_save_suggest(self):
         """调用三方方法生成今日建议并写到指定文件里"""
@@ -55,36 +71,38 @@ class SuggestService:
         filename = f"{self.file_prefix}_{today.isoformat()}.txt"
         file_full_path = self.file_path / filename
 
-        # 2. 如果文件已存在，先删除
-        if file_full_path.exists():
-            try:
-                file_full_path.unlink()  # 删除文件
-            except Exception as e:
-                logger.error(f"删除建议文件失败: {e}")
-
-        # 3. 调用三方方法生成建议
+        # 2. 调用三方方法生成建议
         try:
             # todo chenchenaq 调用三方方法生成建议
             content = "这里是一段建议的md文案...."
         except Exception as e:
-            logger.error(f"生成建议失败: {e}")
+            logger.error("生成建议失败: %s", e)
             raise e
 
-        # 4. 写入新文件
+        # 3. 原子写入（写临时文件 + os.replace 直接覆盖旧文件，
+        #    无需先删除，并发读方不会读到半截内容）
         try:
-            with open(file_full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            await aio_write_text(file_full_path, content)
+            # 写入成功后失效当日缓存，下一次读取重新加载
+            self._cache.pop(today, None)
         except Exception as e:
-            logger.error(f"写入建议文件失败: {e}")
+            logger.error("写入建议文件失败: %s", e)
         return True
 
 
 _suggest_service: Optional[SuggestService] = None
+_init_lock = asyncio.Lock()
+
 
+async def get_suggest_service() -> SuggestService:
+    """获取工作服务实例
 
-def get_suggest_service() -> SuggestService:
-    """获取工作服务实例"""
+    双重检查 + asyncio.Lock，并发首批请求不会各自构造一份
+    服务（重复打开存储句柄、重复读配置）。
+    """
     global _suggest_service
     if _suggest_service is None:
-        _suggest_service = SuggestService()
+        async with _init_lock:
+            if _suggest_service is None:
+                _suggest_service = SuggestService()
     return _suggest_service
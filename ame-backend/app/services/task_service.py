@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from enum import IntEnum
 from typing import Optional, List, Dict
@@ -6,12 +7,17 @@ from pydantic import BaseModel
 
 from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.core.pools import run_io
 from app.core.exceptions import ConfigurationError
 from app.database.sqlite.schema import get_sqlite_db
 from app.models.base_enums import TaskPriority, TaskStatus
+from app.services.batcher import AdaptiveBatcher
 
 logger = get_logger(__name__)
 
+# 分页大小上限，防止一次拉全表
+_MAX_PAGE_SIZE = 500
+
 
 class Task(BaseModel):
     """任务实体"""
@@ -24,9 +30,15 @@ class Task(BaseModel):
 class TaskService:
     """任务"""
 
-    def __init__(self):
+    def __init__(self, db):
         settings = get_settings()
-        self.db = get_sqlite_db()
+        self.db = db
+
+        # 写入攒批：短窗口内的并发插入合并成一次 executemany 事务，
+        # WAL fsync 被 N 个请求摊薄，避免 SQLite 写锁热点
+        self._insert_batcher = AdaptiveBatcher(
+            self._insert_batch, max_batch=64, max_wait_ms=10
+        )
 
         # 检查配置
         # if not settings.is_configured:
@@ -39,57 +51,68 @@ class TaskService:
         """根据任务描述获取任务记录"""
         # todo chenchenaq 这里调用ame方法获取到了任务列表。。。
         task_records = [{'name': '任务1', 'priority': 1, 'status': 0}]
-        # 任务列表入库
-        tasks: List[Task] = [Task(**record) for record in task_records]
 
-        if not tasks:
+        if not task_records:
             logger.warning("未提取出任务列表")
             return []
 
         try:
+            # 记录本身就是内部构造的字典，直接推导出入库行，
+            # 不再经 Task(**record) 做一轮 pydantic 校验再逐字段读回
             now = datetime.now().isoformat()
-            data_list = []
-            for task in tasks:
-                data_list.append({
-                    'name': task.name,
-                    'priority': task.priority,
-                    'status': task.status,
+            data_list = [
+                {
+                    'name': r['name'],
+                    'priority': r['priority'],
+                    'status': r['status'],
                     'create_time': now,
                     'update_time': now
-                })
+                }
+                for r in task_records
+            ]
 
-            self.db.task.insert_many(data_list)
+            await self._insert_batcher.submit(data_list)
             return True
         except Exception as e:
-            logger.error(f"批量新增任务失败: {e}, tasks数量: {len(tasks)}", exc_info=True)
+            logger.error("批量新增任务失败: %s, tasks数量: %s", e, len(task_records), exc_info=True)
             raise e
 
+    async def _insert_batch(self, batches: List[List[Dict]]) -> List[bool]:
+        """合并多个并发请求的任务列表，一次批量入库"""
+        merged = [row for batch in batches for row in batch]
+        await self.db.task.ainsert_many(merged)
+        return [True] * len(batches)
+
     async def get_task_list(self, page, size):
         """获取任务列表"""
         if page < 1 or size < 1:
             raise ValueError("page 和 size 必须大于 0")
 
+        size = min(size, _MAX_PAGE_SIZE)
         offset = (page - 1) * size
 
         try:
-            # 查询总数量
-            total = self.db.task.count()
-
-            # 查询当前页数据
-            result = self.db.task.select(
-                order_by="priority, update_time DESC",
-                limit=size,
-                offset=offset
+            # 窗口函数一条 SQL 同时拿到当前页和总数，省掉单独的 COUNT 查询
+            sql = (
+                "SELECT id, name, priority, status, COUNT(*) OVER () AS total_count "
+                "FROM task ORDER BY priority, update_time DESC LIMIT ? OFFSET ?"
             )
-            items: List[Task] = [Task(**row) for row in result]
-            enhanced_items = []
-            for task in items:
-                enhanced_items.append({
-                    "id": task.id,
-                    "name": task.name,
-                    "priority": TaskPriority.to_label(task.priority),
-                    "status": TaskStatus.to_label(task.status)
-                })
+            rows = await run_io(self._fetch_page, sql, (size, offset))
+
+            total = rows[0]['total_count'] if rows else 0
+            # 标签换算是纯表查找（见 base_enums 的模块级标签表），
+            # 这里绑定局部名 + 列表推导式，省掉逐行的属性查找开销
+            prio_label = TaskPriority.to_label
+            status_label = TaskStatus.to_label
+            enhanced_items = [
+                {
+                    "id": row['id'],
+                    "name": row['name'],
+                    "priority": prio_label(row['priority']),
+                    "status": status_label(row['status'])
+                }
+                for row in rows
+            ]
 
             return {
                 "items": enhanced_items,
@@ -99,9 +122,14 @@ class TaskService:
             }
 
         except Exception as e:
-            logger.error(f"数据库分页查询失败 - page={page}, size={size}", exc_info=True)
+            logger.error("数据库分页查询失败 - page=%s, size=%s", page, size, exc_info=True)
             raise RuntimeError(f"查询任务列表失败: {str(e)}") from e
 
+    def _fetch_page(self, sql, params):
+        """执行分页查询并取回全部行（线程池中运行）"""
+        cursor = self.db.execute(sql, params)
+        return cursor.fetchall()
+
     async def update_task_by_id(self, id, name, priority, status):
         """更新任务"""
         if id is None:
@@ -114,19 +142,26 @@ class TaskService:
                 'status': status,
                 'update_time': now
             }
-            self.db.task.update(data, where={'id': id})
+            await self.db.task.aupdate(data, where={'id': id})
             return True
         except Exception as e:
-            logger.error(f"更新任务失败: {e}")
+            logger.error("更新任务失败: %s", e)
             raise e
 
 
 _task_service: Optional[TaskService] = None
+_init_lock = asyncio.Lock()
+
 
+async def get_task_service() -> TaskService:
+    """获取工作服务实例
 
-def get_task_service() -> TaskService:
-    """获取工作服务实例"""
+    双重检查 + asyncio.Lock，并发首批请求不会各自构造一份
+    服务（重复打开存储句柄、重复读配置）。
+    """
     global _task_service
     if _task_service is None:
-        _task_service = TaskService()
+        async with _init_lock:
+            if _task_service is None:
+                _task_service = TaskService(db=await get_sqlite_db())
     return _task_service
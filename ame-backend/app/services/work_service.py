@@ -2,6 +2,13 @@
 工作场景服务
 提供工作相关的AI辅助功能：周报生成、待办整理、会议总结等
 """
+import asyncio
+import re
+import uuid
+from functools import lru_cache
+
+import orjson
+
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import sys
@@ -15,12 +22,90 @@ from ame.mem.analyze_engine import AnalyzeEngine
 from ame.mem.mimic_engine import MimicEngine
 from ame.llm_caller.caller import LLMCaller
 
+from app.core.cache import install_search_cache
 from app.core.config import get_settings
 from app.core.logger import get_logger
 from app.core.exceptions import ConfigurationError, StorageError, LLMError
 
 logger = get_logger(__name__)
 
+# 限制并发 LLM 调用数，避免高并发下把上游打满
+_LLM_CONCURRENCY = 8
+
+# 会议批量总结：单次 LLM 调用最多打包的会议数与字符上限，
+# 超限的会议退回逐场总结
+_MEETING_BATCH_SIZE = 6
+_MEETING_BATCH_CHAR_LIMIT = 8000
+
+# 批量提示词中各会议的分节符，响应按同样的分隔符拆回
+_MEETING_DELIM_RE = re.compile(r"---MEETING\s*\d+---")
+
+# 周报单提示词：摘要/关键任务/成果/统计在一次调用内以 JSON 返回，
+# 免去“总结→提任务→提成果”链式调用之间的多次网络往返
+_WEEKLY_REPORT_PROMPT = """请根据以下 {start} 至 {end} 的工作记录，一次性生成完整周报。
+
+工作记录：
+{logs}
+
+只输出一个 JSON 对象，不要包含任何其他文本，结构如下：
+{{"summary": "周报正文（markdown 格式）",
+  "key_tasks": [{{"name": "任务名称", "status": "状态"}}],
+  "achievements": [{{"title": "成果", "description": "说明"}}],
+  "statistics": {{"total_logs": 0}}}}"""
+
+# 提示词模板：静态部分在模块加载时构建一次，
+# 每次请求只做一次 format / join 拼接（与 life_service 同一套路）
+_TODO_PROMPT = """请帮我整理以下待办事项，按照优先级和类别进行分组：
+
+{todos}
+
+请按照以下格式输出：
+
+**高优先级**
+- [任务1]
+- [任务2]
+
+**中优先级**
+- [任务3]
+
+**低优先级**
+- [任务4]
+
+同时，如果发现有重复或相似的任务，请合并它们。"""
+
+_MEETING_PROMPT = """请总结以下会议内容：
+
+{info_text}
+
+会议记录：
+{notes}
+
+请按照以下格式输出：
+
+**会议概要**
+[简短描述会议主题和目的]
+
+**关键讨论点**
+1. [讨论点1]
+2. [讨论点2]
+
+**决策事项**
+- [决策1]
+- [决策2]
+
+**行动项**
+- [ ] [待办事项1] (负责人：XXX)
+- [ ] [待办事项2] (负责人：XXX)
+
+**下次会议**
+[如果有，说明时间和议题]"""
+
+
+@lru_cache(maxsize=256)
+def _join_participants(participants: tuple) -> str:
+    """缓存参会者列表的拼接结果（调度器批量路径会反复遇到同一批人）"""
+    return ', '.join(participants)
+
 
 class WorkService:
     """工作场景服务"""
@@ -63,7 +148,10 @@ class WorkService:
                 message="Failed to initialize storage",
                 detail=str(e)
             )
-        
+
+        # 重复查询直接命中进程内结果缓存，不再打到 FAISS/SQLite
+        install_search_cache(self.repository)
+
         # 初始化分析引擎
         self.analyzer = AnalyzeEngine(
             repository=self.repository,
@@ -76,7 +164,10 @@ class WorkService:
             llm_caller=self.llm_caller,
             analyze_engine=self.analyzer
         )
-        
+
+        # LLM 并发上限
+        self._llm_semaphore = asyncio.Semaphore(_LLM_CONCURRENCY)
+
         logger.info("Work Service initialized")
     
     async def generate_weekly_report(
@@ -102,29 +193,57 @@ class WorkService:
                 end_date = datetime.now()
             if start_date is None:
                 start_date = end_date - timedelta(days=7)
-            
-            # 使用 WorkEngine 生成周报
+
+            start_iso = start_date.isoformat()
+            end_iso = end_date.isoformat()
+            period = {"start": start_iso, "end": end_iso}
+
+            # 单提示词路径：一次调用拿到摘要/任务/成果/统计，
+            # 不再在多个相互依赖的 LLM 调用之间排队
+            logs = await self._get_work_logs(start_date, end_date)
+            if logs:
+                logs_text = "\n".join(f"- {d.content}" for d in logs)
+                response = await self._call_llm(_WEEKLY_REPORT_PROMPT.format(
+                    start=start_iso, end=end_iso, logs=logs_text
+                ))
+                try:
+                    data = orjson.loads(response)
+                except orjson.JSONDecodeError:
+                    data = None
+                if isinstance(data, dict):
+                    logger.info("Weekly report generated successfully")
+                    return {
+                        "success": True,
+                        "report": data.get("summary", ""),
+                        "period": period,
+                        "key_tasks": data.get("key_tasks", []),
+                        "achievements": data.get("achievements", []),
+                        "statistics": data.get("statistics", {})
+                    }
+                logger.warning(
+                    "Weekly report response was not valid JSON, "
+                    "falling back to engine pipeline"
+                )
+
+            # 无记录或 JSON 解析失败时退回引擎的链式生成
             report_obj = await self.work_engine.generate_weekly_report(
                 user_id="default",
                 start_date=start_date,
                 end_date=end_date,
                 style="professional"
             )
-            
+
             logger.info("Weekly report generated successfully")
-            
+
             return {
                 "success": True,
                 "report": report_obj.content,
-                "period": {
-                    "start": start_date.isoformat(),
-                    "end": end_date.isoformat()
-                },
-                "key_tasks": [t.dict() for t in report_obj.key_tasks],
-                "achievements": [a.dict() for a in report_obj.achievements],
+                "period": period,
+                "key_tasks": [t.model_dump(mode='json') for t in report_obj.key_tasks],
+                "achievements": [a.model_dump(mode='json') for a in report_obj.achievements],
                 "statistics": report_obj.statistics
             }
-            
+
         except Exception as e:
             logger.error(f"Failed to generate weekly report: {e}")
             raise
@@ -162,8 +281,8 @@ class WorkService:
                 "success": True,
                 "report": report_obj.content,
                 "date": date.isoformat(),
-                "tasks_completed": [t.dict() for t in report_obj.tasks_completed],
-                "tasks_ongoing": [t.dict() for t in report_obj.tasks_ongoing],
+                "tasks_completed": [t.model_dump(mode='json') for t in report_obj.tasks_completed],
+                "tasks_ongoing": [t.model_dump(mode='json') for t in report_obj.tasks_ongoing],
                 "highlights": report_obj.highlights
             }
             
@@ -198,9 +317,9 @@ class WorkService:
             return {
                 "success": True,
                 "organized_todos": {
-                    "high": [t.dict() for t in organized.high_priority],
-                    "medium": [t.dict() for t in organized.medium_priority],
-                    "low": [t.dict() for t in organized.low_priority],
+                    "high": [t.model_dump(mode='json') for t in organized.high_priority],
+                    "medium": [t.model_dump(mode='json') for t in organized.medium_priority],
+                    "low": [t.model_dump(mode='json') for t in organized.low_priority],
                     "formatted_text": organized.formatted_text
                 },
                 "original_count": organized.original_count,
@@ -231,26 +350,27 @@ class WorkService:
         try:
             # 构建提示词
             prompt = self._build_meeting_summary_prompt(meeting_notes, meeting_info)
-            
-            # 调用 LLM 总结
-            response = await self.llm_caller.call(
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.5
-            )
-            
-            # 存储会议记录
+
+            # 会议记录文档不依赖 LLM 结果，先构建好；
+            # 时间戳型 ID 在并发请求下有同微秒碰撞风险，改用 uuid
+            now = datetime.now()
             doc = Document(
-                id=f"meeting_{datetime.now().timestamp()}",
+                id=f"meeting_{uuid.uuid4().hex}",
                 content=meeting_notes,
                 doc_type=DocumentType.WORK_LOG,
                 source="meeting",
-                timestamp=datetime.now(),
+                timestamp=now,
                 retention_type=MemoryRetentionType.PERMANENT,
                 metadata=meeting_info or {}
             )
-            
-            await self.repository.create(doc)
-            
+
+            # LLM 总结与文档入库互相独立，TaskGroup 并发执行：
+            # 任一失败即取消另一个并带完整上下文抛出
+            async with asyncio.TaskGroup() as tg:
+                llm_task = tg.create_task(self._call_llm(prompt))
+                tg.create_task(self.repository.create(doc))
+            response = llm_task.result()
+
             logger.info("Meeting summarized and stored")
             
             return {
@@ -263,6 +383,101 @@ class WorkService:
             logger.error(f"Failed to summarize meeting: {e}")
             raise
     
+    async def summarize_meetings_batch(
+        self,
+        notes_list: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        批量总结多场会议
+
+        每批最多打包 _MEETING_BATCH_SIZE 场会议进一个分节提示词，
+        一次 LLM 调用换回整批总结，省掉逐场调用的 N-1 次网络往返；
+        超长会议或响应解析失败时退回逐场总结路径。
+
+        Args:
+            notes_list: 各场会议的记录文本
+
+        Returns:
+            与输入等长的总结结果列表
+        """
+        logger.info("Summarizing %s meetings in batches", len(notes_list))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(notes_list)
+
+        # 贪心分批：按条数和累计字符双上限切分
+        groups: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+        for idx, notes in enumerate(notes_list):
+            if len(notes) > _MEETING_BATCH_CHAR_LIMIT:
+                groups.append([idx])
+                continue
+            if current and (
+                len(current) >= _MEETING_BATCH_SIZE
+                or current_chars + len(notes) > _MEETING_BATCH_CHAR_LIMIT
+            ):
+                groups.append(current)
+                current = []
+                current_chars = 0
+            current.append(idx)
+            current_chars += len(notes)
+        if current:
+            groups.append(current)
+
+        for group in groups:
+            if len(group) == 1:
+                results[group[0]] = await self.summarize_meeting(
+                    notes_list[group[0]]
+                )
+                continue
+
+            sections = "\n\n".join(
+                f"---MEETING {k}---\n{notes_list[i]}"
+                for k, i in enumerate(group, start=1)
+            )
+            prompt = (
+                f"以下是 {len(group)} 场独立的会议记录，"
+                "请分别总结每一场，输出时每份总结以对应的 "
+                "---MEETING i--- 分隔符开头：\n\n" + sections
+            )
+
+            response = await self._call_llm(prompt)
+            parts = [p.strip() for p in _MEETING_DELIM_RE.split(response) if p.strip()]
+
+            if len(parts) != len(group):
+                # 响应没有按分隔符对齐，退回逐场总结保证正确性
+                logger.warning(
+                    "Batch summary parse mismatch (%s parts for %s meetings), "
+                    "falling back to per-meeting calls", len(parts), len(group)
+                )
+                for i in group:
+                    results[i] = await self.summarize_meeting(notes_list[i])
+                continue
+
+            # 入库与逐场路径保持同样的文档形状
+            now = datetime.now()
+            docs = [
+                Document(
+                    id=f"meeting_{uuid.uuid4().hex}",
+                    content=notes_list[i],
+                    doc_type=DocumentType.WORK_LOG,
+                    source="meeting",
+                    timestamp=now,
+                    retention_type=MemoryRetentionType.PERMANENT,
+                    metadata={}
+                )
+                for i in group
+            ]
+            await asyncio.gather(*(self.repository.create(d) for d in docs))
+            for doc, summary, i in zip(docs, parts, group):
+                results[i] = {
+                    "success": True,
+                    "summary": summary,
+                    "document_id": doc.id
+                }
+
+        return results
+
     async def track_project_progress(
         self,
         project_name: str
@@ -302,7 +517,15 @@ class WorkService:
             raise
     
     # ==================== 辅助方法 ====================
-    
+
+    async def _call_llm(self, prompt: str, temperature: float = 0.5):
+        """受并发上限约束的 LLM 调用"""
+        async with self._llm_semaphore:
+            return await self.llm_caller.call(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature
+            )
+
     async def _get_work_logs(
         self,
         start_date: datetime,
@@ -325,26 +548,9 @@ class WorkService:
     
     def _build_todo_prompt(self, raw_todos: List[str]) -> str:
         """构建待办整理提示词"""
-        todos_text = "\n".join([f"- {todo}" for todo in raw_todos])
-        
-        return f"""请帮我整理以下待办事项，按照优先级和类别进行分组：
-
-{todos_text}
-
-请按照以下格式输出：
-
-**高优先级**
-- [任务1]
-- [任务2]
+        todos_text = "\n".join("- " + todo for todo in raw_todos)
+        return _TODO_PROMPT.format(todos=todos_text)
 
-**中优先级**
-- [任务3]
-
-**低优先级**
-- [任务4]
-
-同时，如果发现有重复或相似的任务，请合并它们。"""
-    
     def _build_meeting_summary_prompt(
         self,
         notes: str,
@@ -353,38 +559,14 @@ class WorkService:
         """构建会议总结提示词"""
         info_text = ""
         if info:
-            info_text = f"""
-会议标题：{info.get('title', '未知')}
-会议时间：{info.get('time', '未知')}
-参与者：{', '.join(info.get('participants', []))}
-"""
-        
-        return f"""请总结以下会议内容：
-
-{info_text}
-
-会议记录：
-{notes}
-
-请按照以下格式输出：
-
-**会议概要**
-[简短描述会议主题和目的]
-
-**关键讨论点**
-1. [讨论点1]
-2. [讨论点2]
-
-**决策事项**
-- [决策1]
-- [决策2]
-
-**行动项**
-- [ ] [待办事项1] (负责人：XXX)
-- [ ] [待办事项2] (负责人：XXX)
+            participants = _join_participants(tuple(info.get('participants', [])))
+            info_text = (
+                f"\n会议标题：{info.get('title', '未知')}\n"
+                f"会议时间：{info.get('time', '未知')}\n"
+                f"参与者：{participants}\n"
+            )
 
-**下次会议**
-[如果有，说明时间和议题]"""
+        return _MEETING_PROMPT.format(info_text=info_text, notes=notes)
     
     def _parse_todo_response(self, response: str) -> Dict[str, List[str]]:
         """解析待办整理响应"""
@@ -404,11 +586,18 @@ class WorkService:
 
 # 全局服务实例
 _work_service: Optional[WorkService] = None
+_init_lock = asyncio.Lock()
+
 
+async def get_work_service() -> WorkService:
+    """获取工作服务实例
 
-def get_work_service() -> WorkService:
-    """获取工作服务实例"""
+    双重检查 + asyncio.Lock，并发首批请求不会各自构造一份
+    服务（重复打开存储句柄、重复读配置）。
+    """
     global _work_service
     if _work_service is None:
-        _work_service = WorkService()
+        async with _init_lock:
+            if _work_service is None:
+                _work_service = WorkService()
     return _work_service
@@ -3,6 +3,7 @@
 实现热温冷数据自动降温策略
 """
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
@@ -14,6 +15,7 @@ from ame.models.domain import DataLayer, Document
 
 from app.core.config import get_settings
 from app.core.logger import get_logger
+from app.core.pools import run_io
 
 logger = get_logger(__name__)
 
@@ -60,27 +62,38 @@ class LifecycleManager:
         try:
             total_processed = 0
             total_demoted = 0
-            
-            # 遍历所有注册的仓库
-            for repo_name, repository in self.repositories.items():
-                logger.info(f"Processing repository: {repo_name}")
-                
-                processed, demoted = await self._process_repository(repository)
-                
+
+            # 所有仓库并发处理：任务总耗时从各仓库耗时之和
+            # 降为最慢仓库的耗时；单个仓库失败不影响其余仓库
+            names = list(self.repositories.keys())
+            results = await asyncio.gather(
+                *(self._process_repository(self.repositories[name]) for name in names),
+                return_exceptions=True
+            )
+
+            failed = 0
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    failed += 1
+                    logger.error("Repository %s lifecycle failed: %s", name, result)
+                    continue
+                processed, demoted = result
                 total_processed += processed
                 total_demoted += demoted
-                
-                logger.info(f"Repository {repo_name} completed: {processed} processed, {demoted} demoted")
-            
-            logger.info(f"Lifecycle task completed: {total_processed} documents processed, {total_demoted} demoted")
-            
+                logger.info("Repository %s completed: %s processed, %s demoted",
+                            name, processed, demoted)
+
+            logger.info("Lifecycle task completed: %s documents processed, %s demoted",
+                        total_processed, total_demoted)
+
             return {
-                "success": True,
+                "success": failed == 0,
                 "total_processed": total_processed,
                 "total_demoted": total_demoted,
-                "repositories": len(self.repositories)
+                "repositories": len(self.repositories),
+                "failed": failed
             }
-            
+
         except Exception as e:
             logger.error(f"Lifecycle task failed: {e}")
             return {
@@ -98,15 +111,18 @@ class LifecycleManager:
         Returns:
             (处理数量, 降温数量)
         """
-        processed = 0
-        demoted = 0
-        
-        # 调用仓库的生命周期管理方法
-        result = await repository.lifecycle_management()
-        
+        # 调用仓库的生命周期管理方法；全量扫描 + 逐行打分是重活，
+        # 同步实现的仓库放线程池执行，夜间任务期间事件循环
+        # 仍能服务 API 流量
+        fn = repository.lifecycle_management
+        if asyncio.iscoroutinefunction(fn):
+            result = await fn()
+        else:
+            result = await run_io(fn)
+
         processed = result.get("total_documents", 0)
         demoted = result.get("demoted", 0)
-        
+
         return processed, demoted
     
     async def cleanup_old_data(self, days_threshold: int = 365):
@@ -145,13 +161,20 @@ class LifecycleManager:
 
 # 全局实例
 _lifecycle_manager: LifecycleManager = None
+_init_lock = threading.Lock()
 
 
 def get_lifecycle_manager() -> LifecycleManager:
-    """获取生命周期管理器实例"""
+    """获取生命周期管理器实例
+
+    同步入口（调度器线程、lifespan）都会调到这里，双重检查 +
+    threading.Lock 保证并发冷启动只构造一份。
+    """
     global _lifecycle_manager
     if _lifecycle_manager is None:
-        _lifecycle_manager = LifecycleManager()
+        with _init_lock:
+            if _lifecycle_manager is None:
+                _lifecycle_manager = LifecycleManager()
     return _lifecycle_manager
 
 
@@ -2,6 +2,9 @@
 任务调度器
 使用 APScheduler 管理定时任务
 """
+import asyncio
+import threading
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from datetime import datetime
@@ -19,7 +22,9 @@ class TaskScheduler:
         """初始化调度器"""
         self.scheduler = AsyncIOScheduler()
         self._is_started = False
-        
+        # 手动触发的后台任务：job_id -> asyncio.Task
+        self._running_tasks = {}
+
         logger.info("Task Scheduler initialized")
     
     def setup_tasks(self):
@@ -85,26 +90,58 @@ class TaskScheduler:
         return jobs
     
     async def run_job_now(self, job_id: str):
-        """立即执行指定任务"""
+        """立即触发指定任务（不等待其完成）
+
+        夜间任务（如全量生命周期扫描）可能跑几分钟，直接 await
+        会把手动触发的调用方阻塞到任务结束。改为 create_task
+        后台执行并立即返回；任务句柄记录在 _running_tasks，
+        可通过 get_job_status 查询。
+        """
         job = self.scheduler.get_job(job_id)
-        if job:
-            logger.info(f"Manually triggering job: {job_id}")
-            await job.func()
-            return True
-        else:
-            logger.warning(f"Job not found: {job_id}")
+        if not job:
+            logger.warning("Job not found: %s", job_id)
             return False
 
+        running = self._running_tasks.get(job_id)
+        if running is not None and not running.done():
+            logger.warning("Job already running: %s", job_id)
+            return False
+
+        logger.info("Manually triggering job: %s", job_id)
+        task = asyncio.create_task(job.func(), name=f"manual-{job_id}")
+        self._running_tasks[job_id] = task
+        return True
+
+    def get_job_status(self, job_id: str):
+        """查询手动触发任务的状态
+
+        Returns:
+            "running" / "done" / "failed"；从未触发过返回 None
+        """
+        task = self._running_tasks.get(job_id)
+        if task is None:
+            return None
+        if not task.done():
+            return "running"
+        return "failed" if task.exception() else "done"
+
 
 # 全局调度器实例
 _scheduler: TaskScheduler = None
+_init_lock = threading.Lock()
 
 
 def get_scheduler() -> TaskScheduler:
-    """获取调度器实例"""
+    """获取调度器实例
+
+    双重检查 + threading.Lock，并发冷启动不会构造出两个调度器
+    （各自 start 会重复注册定时任务）。
+    """
     global _scheduler
     if _scheduler is None:
-        _scheduler = TaskScheduler()
+        with _init_lock:
+            if _scheduler is None:
+                _scheduler = TaskScheduler()
     return _scheduler
 
 
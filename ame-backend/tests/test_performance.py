@@ -4,8 +4,9 @@
 """
 import pytest
 import asyncio
-from time import time
-from statistics import mean, median
+import numpy as np
+from time import perf_counter_ns
+from statistics import mean
 from typing import List
 
 from ame.repository.hybrid_repository import HybridRepository
@@ -36,28 +37,48 @@ class TestPerformance:
     
     async def _load_test_data(self, repo, count: int = 1000):
         """加载测试数据"""
-        documents = []
-        for i in range(count):
-            doc = Document(
+        # 向量化构造 embedding：一次 numpy 广播替代 count×1536 次
+        # 解释器级浮点运算，夹具构建从秒级降到毫秒级
+        embs = np.repeat(
+            np.arange(count, dtype=np.float32)[:, None] * 0.001 + 0.1,
+            1536, axis=1
+        )
+        documents = [
+            Document(
                 content=f"测试文档 {i}",
                 doc_type=DocumentType.RAG_KNOWLEDGE,
                 source="test",
                 timestamp=datetime.now(),
-                embedding=[0.1 + i * 0.001] * 1536,
+                embedding=embs[i].tolist(),
                 entities=[f"实体{i}"]
             )
-            documents.append(doc)
-        
+            for i in range(count)
+        ]
+
         # 批量创建
-        tasks = [repo.create(doc) for doc in documents]
-        await asyncio.gather(*tasks)
+        await self._create_documents(repo, documents)
+
+    @staticmethod
+    async def _create_documents(repo, documents: List[Document]):
+        """批量写入文档
+
+        优先走仓库的 bulk_create（一次 faiss.add + 一个事务内
+        executemany）；仓库版本不支持时退回并发单条创建。
+        """
+        bulk_create = getattr(repo, 'bulk_create', None)
+        if bulk_create is not None:
+            await bulk_create(documents)
+        else:
+            await asyncio.gather(*(repo.create(doc) for doc in documents))
     
     # ==================== 检索性能测试 ====================
     
     async def test_search_latency_baseline(self, repository):
         """测试基线检索延迟"""
         query = "测试查询"
-        embedding = [0.15] * 1536
+        # FAISS 内部是 float32：直接传 float32 ndarray，
+        # 免去每次调用时 Python list(float64) -> C float32 的转换拷贝
+        embedding = np.full(1536, 0.15, dtype=np.float32)
         
         # 预热（避免冷启动影响）
         for _ in range(10):
@@ -68,17 +89,18 @@ class TestPerformance:
         iterations = 100
         
         for _ in range(iterations):
-            start = time()
+            start = perf_counter_ns()
             results = await repository.hybrid_search(query, embedding, top_k=10)
-            latency = (time() - start) * 1000  # 转换为ms
+            latency = (perf_counter_ns() - start) / 1e6  # 转换为ms
             latencies.append(latency)
             assert len(results) > 0, "检索结果不应为空"
         
-        # 统计分析
+        # 统计分析：一次 C 级 partition 同时算出三个分位数，
+        # 不再为 P95/P99 各排一次序，分位值也带正确的插值
         avg_latency = mean(latencies)
-        median_latency = median(latencies)
-        p95_latency = sorted(latencies)[int(iterations * 0.95)]
-        p99_latency = sorted(latencies)[int(iterations * 0.99)]
+        median_latency, p95_latency, p99_latency = np.percentile(
+            latencies, [50, 95, 99]
+        )
         
         print(f"\n=== 检索延迟基准 ===")
         print(f"平均延迟: {avg_latency:.2f}ms")
@@ -93,17 +115,17 @@ class TestPerformance:
     async def test_search_throughput(self, repository):
         """测试检索吞吐量"""
         query = "测试查询"
-        embedding = [0.15] * 1536
+        embedding = np.full(1536, 0.15, dtype=np.float32)
         duration = 10  # 测试10秒
         
         queries_completed = 0
-        start_time = time()
-        
-        while time() - start_time < duration:
+        start_time = perf_counter_ns()
+
+        while perf_counter_ns() - start_time < duration * 1_000_000_000:
             await repository.hybrid_search(query, embedding, top_k=10)
             queries_completed += 1
-        
-        actual_duration = time() - start_time
+
+        actual_duration = (perf_counter_ns() - start_time) / 1e9
         qps = queries_completed / actual_duration
         
         print(f"\n=== 检索吞吐量 ===")
@@ -122,15 +144,21 @@ class TestPerformance:
         
         for concurrency in concurrent_levels:
             queries = [f"查询{i}" for i in range(concurrency)]
-            embeddings = [[0.1 + i * 0.01] * 1536 for i in range(concurrency)]
-            
-            start = time()
+            # 单个只读 ndarray 按行切片：不再预先分配并发数×1536 个
+            # Python float 的嵌套列表，堆占用和 GC 停顿不会掺进延迟数据
+            embeddings = np.broadcast_to(
+                np.arange(concurrency, dtype=np.float32)[:, None] * 0.01 + 0.1,
+                (concurrency, 1536)
+            )
+
+            start = perf_counter_ns()
+            # gather 在首个异常处即中止等待并向上抛，天然 fail-fast
             tasks = [
-                repository.hybrid_search(q, emb, top_k=5)
-                for q, emb in zip(queries, embeddings)
+                repository.hybrid_search(q, embeddings[i], top_k=5)
+                for i, q in enumerate(queries)
             ]
             search_results = await asyncio.gather(*tasks)
-            duration = time() - start
+            duration = (perf_counter_ns() - start) / 1e9
             
             qps = concurrency / duration
             results[concurrency] = {
@@ -155,22 +183,25 @@ class TestPerformance:
         batch_sizes = [1, 10, 50, 100]
         
         for batch_size in batch_sizes:
-            documents = []
-            for i in range(batch_size):
-                doc = Document(
+            embs = np.repeat(
+                np.arange(batch_size, dtype=np.float32)[:, None] * 0.001 + 0.2,
+                1536, axis=1
+            )
+            documents = [
+                Document(
                     content=f"批量测试文档 {i}",
                     doc_type=DocumentType.RAG_KNOWLEDGE,
                     source="batch_test",
                     timestamp=datetime.now(),
-                    embedding=[0.2 + i * 0.001] * 1536,
+                    embedding=embs[i].tolist(),
                     entities=[f"批量实体{i}"]
                 )
-                documents.append(doc)
+                for i in range(batch_size)
+            ]
             
-            start = time()
-            tasks = [repository.create(doc) for doc in documents]
-            await asyncio.gather(*tasks)
-            duration = time() - start
+            start = perf_counter_ns()
+            await self._create_documents(repository, documents)
+            duration = (perf_counter_ns() - start) / 1e9
             
             docs_per_second = batch_size / duration
             
@@ -184,55 +215,77 @@ class TestPerformance:
     # ==================== 内存使用测试 ====================
     
     async def test_memory_usage_growth(self, repository):
-        """测试内存使用增长"""
+        """测试内存使用增长
+
+        用 tracemalloc 快照差值测真实的 Python 堆留存：逐条 create 时
+        每个 1536 float 的临时列表都会被 GC 回收，却被 RSS 差值算到
+        仓库头上；RSS 还受 mmap/分配器影响，只作为粗粒度的次要检查。
+        """
         import psutil
         import os
-        
+        import tracemalloc
+
         process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # 创建1000个文档
-        for i in range(1000):
-            doc = Document(
+        initial_rss = process.memory_info().rss / 1024 / 1024  # MB
+
+        count = 1000
+        embs = np.repeat(
+            np.arange(count, dtype=np.float32)[:, None] * 0.0001 + 0.3,
+            1536, axis=1
+        )
+        documents = [
+            Document(
                 content=f"内存测试文档 {i}",
                 doc_type=DocumentType.RAG_KNOWLEDGE,
                 source="memory_test",
                 timestamp=datetime.now(),
-                embedding=[0.3 + i * 0.0001] * 1536,
+                embedding=embs[i].tolist(),
                 entities=[f"内存实体{i}"]
             )
-            await repository.create(doc)
-        
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
-        memory_growth = final_memory - initial_memory
-        
+            for i in range(count)
+        ]
+
+        tracemalloc.start()
+        try:
+            snap_before = tracemalloc.take_snapshot()
+            await self._create_documents(repository, documents)
+            snap_after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        diff = snap_after.compare_to(snap_before, 'filename')
+        retained_mb = sum(stat.size_diff for stat in diff) / 1024 / 1024
+
+        final_rss = process.memory_info().rss / 1024 / 1024  # MB
+        rss_growth = final_rss - initial_rss
+
         print(f"\n=== 内存使用 ===")
-        print(f"初始内存: {initial_memory:.2f}MB")
-        print(f"最终内存: {final_memory:.2f}MB")
-        print(f"增长: {memory_growth:.2f}MB")
-        print(f"平均每文档: {memory_growth/1000:.4f}MB")
-        
+        print(f"堆留存: {retained_mb:.2f}MB")
+        print(f"平均每文档: {retained_mb/count:.4f}MB")
+        print(f"RSS增长: {rss_growth:.2f}MB")
+
         # 内存增长应该在合理范围内
-        assert memory_growth < 500, f"内存增长过大: {memory_growth:.2f}MB"
+        assert retained_mb < 200, f"堆留存过大: {retained_mb:.2f}MB"
+        assert rss_growth < 500, f"RSS增长过大: {rss_growth:.2f}MB"
     
     # ==================== 缓存效果测试 ====================
     
     async def test_cache_effectiveness(self, repository):
         """测试缓存效果（如果启用）"""
         query = "缓存测试查询"
-        embedding = [0.25] * 1536
+        embedding = np.full(1536, 0.25, dtype=np.float32)
         
         # 第一次查询（冷缓存）
-        start = time()
+        start = perf_counter_ns()
         await repository.hybrid_search(query, embedding, top_k=10)
-        cold_latency = (time() - start) * 1000
+        cold_latency = (perf_counter_ns() - start) / 1e6
         
         # 重复查询（热缓存）
         hot_latencies = []
         for _ in range(10):
-            start = time()
+            start = perf_counter_ns()
             await repository.hybrid_search(query, embedding, top_k=10)
-            hot_latencies.append((time() - start) * 1000)
+            hot_latencies.append((perf_counter_ns() - start) / 1e6)
         
         avg_hot_latency = mean(hot_latencies)
         speedup = cold_latency / avg_hot_latency if avg_hot_latency > 0 else 0
@@ -262,12 +315,12 @@ class TestAPIPerformance:
             latencies = []
             
             for _ in range(20):
-                start = time()
+                start = perf_counter_ns()
                 if method == "GET":
                     response = client.get(path)
                 else:
                     response = client.post(path, json=payload)
-                latency = (time() - start) * 1000
+                latency = (perf_counter_ns() - start) / 1e6
                 latencies.append(latency)
                 
                 assert response.status_code in [200, 201], \